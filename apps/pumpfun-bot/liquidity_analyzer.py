@@ -4,9 +4,12 @@ Retrieves initial liquidity or bonding pool value for pump.fun tokens.
 """
 
 import asyncio
+import base64
 import json
 import os
+import struct
 import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from solana.rpc.async_api import AsyncClient
 from solders.pubkey import Pubkey
@@ -15,9 +18,65 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# In-memory cache for liquidity analysis results
-_liquidity_cache = {}
+# In-memory LRU cache for liquidity analysis results: mint -> (liquidity, cached_at)
+_liquidity_cache: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
 _liquidity_cache_ttl = 180  # 3 minutes cache TTL for liquidity
+_liquidity_cache_max_size = 50
+
+PUMP_PROGRAM = Pubkey.from_string("6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P")
+BONDING_CURVE_SEED = b"bonding-curve"
+
+# Bonding curve account layout: 8-byte discriminator, then little-endian u64
+# virtual_token_reserves, virtual_sol_reserves, real_token_reserves, ...
+_VIRTUAL_SOL_RESERVES = struct.Struct("<Q")
+_VIRTUAL_SOL_RESERVES_OFFSET = 16
+
+
+def get_bonding_curve_address(token_mint: str) -> Pubkey:
+    """
+    Derive the pump.fun bonding curve account for a token mint.
+    
+    Args:
+        token_mint: The token mint address as string
+        
+    Returns:
+        Pubkey: Bonding curve program-derived address
+    """
+    mint_pubkey = Pubkey.from_string(token_mint)
+    bonding_curve_pubkey, _ = Pubkey.find_program_address(
+        [BONDING_CURVE_SEED, bytes(mint_pubkey)],
+        PUMP_PROGRAM
+    )
+    return bonding_curve_pubkey
+
+
+def parse_bonding_curve_liquidity(account_value: Optional[Dict[str, Any]]) -> float:
+    """
+    Read the virtual SOL reserves from a raw getAccountInfo result.
+    
+    This is the same virtual_sol_reserves figure the pump.fun API reports
+    (get_initial_liquidity_async's primary source), read straight from the
+    bonding curve account rather than its lamport balance.
+    
+    Args:
+        account_value: The 'value' of a base64-encoded getAccountInfo JSON-RPC result
+        
+    Returns:
+        float: Liquidity in SOL, 0.0 if the account is missing or too short
+    """
+    if not account_value:
+        return 0.0
+    
+    data = account_value.get('data') or []
+    if not data:
+        return 0.0
+    
+    raw = base64.b64decode(data[0])
+    if len(raw) < _VIRTUAL_SOL_RESERVES_OFFSET + _VIRTUAL_SOL_RESERVES.size:
+        return 0.0
+    
+    (virtual_sol_reserves,) = _VIRTUAL_SOL_RESERVES.unpack_from(raw, _VIRTUAL_SOL_RESERVES_OFFSET)
+    return virtual_sol_reserves / 1_000_000_000
 
 
 def get_initial_liquidity(token_mint: str) -> float:
@@ -55,37 +114,29 @@ async def get_initial_liquidity_async(token_mint: str) -> float:
     """
     # Check cache first to avoid API calls
     current_time = time.time()
-    if token_mint in _liquidity_cache:
-        cached_result, cached_time = _liquidity_cache[token_mint]
-        if current_time - cached_time < _liquidity_cache_ttl:
-            logger.debug(f"Using cached liquidity for {token_mint}: {cached_result} SOL")
-            return cached_result
+    cached_result = get_cached_liquidity(token_mint, current_time)
+    if cached_result is not None:
+        logger.debug(f"Using cached liquidity for {token_mint}: {cached_result} SOL")
+        return cached_result
     
     try:
         # Method 1: Try pump.fun API first (most accurate)
         liquidity = await _get_liquidity_from_pumpfun_api(token_mint)
         if liquidity > 0:
-            # Cache the result
-            _liquidity_cache[token_mint] = (liquidity, current_time)
+            cache_liquidity(token_mint, liquidity, current_time)
             return liquidity
             
         # Method 2: Try to estimate from bonding curve account
         liquidity = await _get_liquidity_from_bonding_curve(token_mint)
         if liquidity > 0:
-            # Cache the result
-            _liquidity_cache[token_mint] = (liquidity, current_time)
+            cache_liquidity(token_mint, liquidity, current_time)
             return liquidity
             
         # Method 3: Use Helius API for token account analysis
         liquidity = await _get_liquidity_from_helius(token_mint)
         
-        # Cache even zero results for a short time to avoid repeated failed calls
-        _liquidity_cache[token_mint] = (liquidity, current_time)
-        
-        # Clean old cache entries (keep only last 50 entries)
-        if len(_liquidity_cache) > 50:
-            oldest_key = min(_liquidity_cache.keys(), key=lambda k: _liquidity_cache[k][1])
-            del _liquidity_cache[oldest_key]
+        # Cache even zero results to avoid repeated failed calls
+        cache_liquidity(token_mint, liquidity, current_time)
         
         return liquidity
         
@@ -94,6 +145,35 @@ async def get_initial_liquidity_async(token_mint: str) -> float:
         return 0.0
 
 
+def get_cached_liquidity(token_mint: str, current_time: Optional[float] = None) -> Optional[float]:
+    """
+    Return a fresh cached liquidity value for a mint, or None on a miss.
+    
+    Args:
+        token_mint: The token mint address as string
+        current_time: time.time() reading to check freshness against (default: now)
+    """
+    entry = _liquidity_cache.get(token_mint)
+    if entry is None:
+        return None
+    
+    liquidity, cached_at = entry
+    if (current_time or time.time()) - cached_at >= _liquidity_cache_ttl:
+        del _liquidity_cache[token_mint]
+        return None
+    
+    _liquidity_cache.move_to_end(token_mint)
+    return liquidity
+
+
+def cache_liquidity(token_mint: str, liquidity: float, cached_at: Optional[float] = None) -> None:
+    """Store a liquidity value as most recently used, evicting the LRU entry if full."""
+    _liquidity_cache[token_mint] = (liquidity, cached_at or time.time())
+    _liquidity_cache.move_to_end(token_mint)
+    if len(_liquidity_cache) > _liquidity_cache_max_size:
+        _liquidity_cache.popitem(last=False)
+
+
 async def _get_liquidity_from_pumpfun_api(token_mint: str, retry_count: int = 0) -> float:
     """
     Try to get liquidity data from pump.fun API with exponential backoff.
@@ -163,14 +243,7 @@ async def _get_liquidity_from_bonding_curve(token_mint: str) -> float:
         
         try:
             # Derive bonding curve address using pump.fun's standard derivation
-            mint_pubkey = Pubkey.from_string(token_mint)
-            bonding_curve_seed = b"bonding-curve"
-            pump_program = Pubkey.from_string("6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P")
-            
-            bonding_curve_pubkey, _ = Pubkey.find_program_address(
-                [bonding_curve_seed, bytes(mint_pubkey)],
-                pump_program
-            )
+            bonding_curve_pubkey = get_bonding_curve_address(token_mint)
             
             # Get bonding curve account data
             response = await client.get_account_info(bonding_curve_pubkey)
@@ -5,24 +5,27 @@ Reports token intelligence and wallet reputation to shared memory system.
 
 import json
 import time
+import asyncio
 import logging
+import functools
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 from utils import (
     post_to_memory, 
+    post_to_memory_async,
     get_from_memory, 
     ping_memory_server,
     log_event,
     format_token_data,
     format_wallet_intel,
-    get_config
+    get_bot_info
 )
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenData:
     """Token data structure for memory reporting."""
     mint: str
@@ -41,7 +44,7 @@ class TokenData:
             self.alerted_at = time.time()
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletIntel:
     """Wallet intelligence data structure."""
     address: str
@@ -64,6 +67,39 @@ class MemoryReporter:
         """Initialize memory reporter with environment configuration."""
         log_event("Initializing memory reporter")
     
+    def _build_token_payload(self, token_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build the /memory/append_token payload, or None if required fields are missing."""
+        # Ensure required fields
+        if not all(field in token_data for field in ['mint', 'symbol', 'creator']):
+            log_event(f"Missing required fields in token data: {token_data}", 'error')
+            return None
+        
+        # Create structured token data
+        token_obj = TokenData(
+            mint=token_data['mint'],
+            symbol=token_data['symbol'],
+            creator=token_data['creator'],
+            name=token_data.get('name'),
+            alerted_by=get_bot_info()['identifier'],
+            liquidity_sol=token_data.get('liquidity_sol'),
+            quality_score=token_data.get('quality_score'),
+            filter_reasons=token_data.get('filter_reasons', [])
+        )
+        
+        # Flat dict literal instead of asdict(), which deep-copies every field
+        return {
+            'mint': token_obj.mint,
+            'symbol': token_obj.symbol,
+            'creator': token_obj.creator,
+            'name': token_obj.name,
+            'alerted_by': token_obj.alerted_by,
+            'alerted_at': token_obj.alerted_at,
+            'status': token_obj.status,
+            'liquidity_sol': token_obj.liquidity_sol,
+            'quality_score': token_obj.quality_score,
+            'filter_reasons': token_obj.filter_reasons
+        }
+    
     def report_token_to_memory(self, token_data: Dict[str, Any]) -> bool:
         """
         Report token data to shared memory.
@@ -75,28 +111,41 @@ class MemoryReporter:
             bool: True if successful, False otherwise
         """
         try:
-            # Ensure required fields
-            if not all(field in token_data for field in ['mint', 'symbol', 'creator']):
-                log_event(f"Missing required fields in token data: {token_data}", 'error')
+            payload = self._build_token_payload(token_data)
+            if payload is None:
                 return False
             
-            # Create structured token data
-            token_obj = TokenData(
-                mint=token_data['mint'],
-                symbol=token_data['symbol'],
-                creator=token_data['creator'],
-                name=token_data.get('name'),
-                alerted_by=get_config('BOT_IDENTIFIER', 'BOT1'),
-                liquidity_sol=token_data.get('liquidity_sol'),
-                quality_score=token_data.get('quality_score'),
-                filter_reasons=token_data.get('filter_reasons', [])
-            )
-            
             # Send to memory server using utils function
-            success = post_to_memory('/memory/append_token', asdict(token_obj))
+            success = post_to_memory('/memory/append_token', payload)
+            
+            if success:
+                log_event(f"Reported token {payload['symbol']} to memory server")
+            
+            return success
+                
+        except Exception as e:
+            log_event(f"Error reporting token to memory: {e}", 'error')
+            return False
+    
+    async def report_token_to_memory_async(self, token_data: Dict[str, Any]) -> bool:
+        """
+        Async version: Report token data to shared memory over the pooled aiohttp session.
+        
+        Args:
+            token_data: Dictionary containing token information
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            payload = self._build_token_payload(token_data)
+            if payload is None:
+                return False
+            
+            success = await post_to_memory_async('/memory/append_token', payload)
             
             if success:
-                log_event(f"Reported token {token_obj.symbol} to memory server")
+                log_event(f"Reported token {payload['symbol']} to memory server")
             
             return success
                 
@@ -163,6 +212,25 @@ class MemoryReporter:
         
         return self._report_wallet_intel(wallet_intel)
     
+    async def report_suspicious_wallet_async(self, address: str, reason: str) -> bool:
+        """
+        Async version: Report a wallet as suspicious (potential risk).
+        
+        Args:
+            address: Wallet address
+            reason: Reason for suspicion
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        wallet_intel = format_wallet_intel(
+            address=address,
+            reputation="suspicious", 
+            reason=reason
+        )
+        
+        return await self._report_wallet_intel_async(wallet_intel)
+    
     def _report_wallet_intel(self, wallet_intel: Dict[str, Any]) -> bool:
         """
         Internal method to report wallet intelligence.
@@ -185,6 +253,20 @@ class MemoryReporter:
             log_event(f"Error reporting wallet intel: {e}", 'error')
             return False
     
+    async def _report_wallet_intel_async(self, wallet_intel: Dict[str, Any]) -> bool:
+        """Async version of _report_wallet_intel, over the pooled aiohttp session."""
+        try:
+            success = await post_to_memory_async('/memory/update_wallet', wallet_intel)
+            
+            if success:
+                log_event(f"Reported {wallet_intel['reputation']} wallet {wallet_intel['address'][:8]}... to memory")
+            
+            return success
+                
+        except Exception as e:
+            log_event(f"Error reporting wallet intel: {e}", 'error')
+            return False
+    
     def get_wallet_reputation(self, address: str) -> Optional[Dict[str, Any]]:
         """
         Get wallet reputation from memory server.
@@ -212,8 +294,15 @@ class MemoryReporter:
         return ping_memory_server()
 
 
-# Global memory reporter instance
-memory_reporter = MemoryReporter()
+@functools.cache
+def get_memory_reporter() -> MemoryReporter:
+    """
+    Get the shared memory reporter instance, creating it on first use.
+    
+    Returns:
+        MemoryReporter: Process-wide reporter instance
+    """
+    return MemoryReporter()
 
 
 def report_token_to_memory(token_data: Dict[str, Any]) -> bool:
@@ -226,7 +315,20 @@ def report_token_to_memory(token_data: Dict[str, Any]) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    return memory_reporter.report_token_to_memory(token_data)
+    return get_memory_reporter().report_token_to_memory(token_data)
+
+
+async def report_token_to_memory_async(token_data: Dict[str, Any]) -> bool:
+    """
+    Async version: Convenience function to report token data to shared memory.
+    
+    Args:
+        token_data: Dictionary containing token information
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return await get_memory_reporter().report_token_to_memory_async(token_data)
 
 
 def report_trusted_wallet(address: str, reason: str, success_rate: float = None) -> bool:
@@ -241,7 +343,7 @@ def report_trusted_wallet(address: str, reason: str, success_rate: float = None)
     Returns:
         bool: True if successful, False otherwise
     """
-    return memory_reporter.report_trusted_wallet(address, reason, success_rate)
+    return get_memory_reporter().report_trusted_wallet(address, reason, success_rate)
 
 
 def report_blocked_wallet(address: str, reason: str) -> bool:
@@ -255,7 +357,7 @@ def report_blocked_wallet(address: str, reason: str) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    return memory_reporter.report_blocked_wallet(address, reason)
+    return get_memory_reporter().report_blocked_wallet(address, reason)
 
 
 def report_suspicious_wallet(address: str, reason: str) -> bool:
@@ -269,7 +371,21 @@ def report_suspicious_wallet(address: str, reason: str) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    return memory_reporter.report_suspicious_wallet(address, reason)
+    return get_memory_reporter().report_suspicious_wallet(address, reason)
+
+
+async def report_suspicious_wallet_async(address: str, reason: str) -> bool:
+    """
+    Async version: Convenience function to report a suspicious wallet.
+    
+    Args:
+        address: Wallet address
+        reason: Reason for suspicion
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return await get_memory_reporter().report_suspicious_wallet_async(address, reason)
 
 
 def get_wallet_reputation(address: str) -> Optional[Dict[str, Any]]:
@@ -282,14 +398,18 @@ def get_wallet_reputation(address: str) -> Optional[Dict[str, Any]]:
     Returns:
         dict: Wallet reputation or None
     """
-    return memory_reporter.get_wallet_reputation(address)
+    return get_memory_reporter().get_wallet_reputation(address)
 
 
 # Example usage for integration with webhook alert bot
-def enhanced_token_handler_with_memory(token_info, should_alert_result: bool, filter_details: Dict[str, Any] = None):
+async def enhanced_token_handler_with_memory(token_info, should_alert_result: bool, filter_details: Dict[str, Any] = None):
     """
     Enhanced token handler that reports to memory regardless of alert status.
     
+    The memory API calls go through the pooled aiohttp session, so the
+    caller's event loop (e.g. the websocket consume loop) keeps running
+    while they are in flight.
+    
     Args:
         token_info: TokenInfo object from pump monitor
         should_alert_result: Result from should_alert() function
@@ -314,12 +434,7 @@ def enhanced_token_handler_with_memory(token_info, should_alert_result: bool, fi
             })
         
         # Report to memory
-        success = report_token_to_memory(token_data)
-        
-        if success:
-            logger.info(f"📝 Reported {token_info.symbol} to shared memory")
-        else:
-            logger.warning(f"Failed to report {token_info.symbol} to memory")
+        reports = [report_token_to_memory_async(token_data)]
         
         # Update wallet reputation based on filter results
         if filter_details and filter_details.get("rejection_reasons"):
@@ -328,11 +443,22 @@ def enhanced_token_handler_with_memory(token_info, should_alert_result: bool, fi
             
             # Check for suspicious patterns
             if any("suspicious wallet" in reason.lower() for reason in reasons):
-                report_suspicious_wallet(creator, f"Created filtered token {token_info.symbol}: {'; '.join(reasons)}")
+                reports.append(report_suspicious_wallet_async(
+                    creator,
+                    f"Created filtered token {token_info.symbol}: {'; '.join(reasons)}"
+                ))
             elif any("low liquidity" in reason.lower() for reason in reasons):
                 # Don't penalize for low liquidity alone, might be legitimate
                 pass
         
+        # Token and wallet reports are independent, so send them concurrently
+        results = await asyncio.gather(*reports, return_exceptions=True)
+        
+        if results[0] is True:
+            logger.info(f"📝 Reported {token_info.symbol} to shared memory")
+        else:
+            logger.warning(f"Failed to report {token_info.symbol} to memory")
+        
     except Exception as e:
         logger.error(f"Error in enhanced token handler with memory: {e}")
 
@@ -346,7 +472,7 @@ def test_memory_reporter():
     
     # Test server connectivity
     print("📡 Testing memory server connectivity...")
-    is_reachable = memory_reporter.ping_memory_server()
+    is_reachable = get_memory_reporter().ping_memory_server()
     print(f"   Server reachable: {is_reachable}")
     
     if not is_reachable:
@@ -378,7 +504,7 @@ def test_memory_reporter():
     print(f"   Suspicious wallet report: {success}")
     
     # Get reputation
-    reputation = memory_reporter.get_wallet_reputation(test_creator)
+    reputation = get_memory_reporter().get_wallet_reputation(test_creator)
     print(f"   Retrieved reputation: {reputation}")
     
     print("\n✅ Memory reporter test completed")
@@ -13,10 +13,9 @@ import logging
 import base64
 import struct
 from typing import Optional, Callable, Awaitable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import websockets
-import base58
 from solders.pubkey import Pubkey
 
 # Pump.fun program constants from the official repository
@@ -26,10 +25,12 @@ ASSOCIATED_TOKEN_PROGRAM = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25e
 
 # Create instruction discriminator from official bot
 CREATE_DISCRIMINATOR = 8530921459188068891
+_CREATE_DISC_BYTES = struct.pack("<Q", CREATE_DISCRIMINATOR)
+_U32 = struct.Struct("<I")
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class TokenInfo:
     """Token information extracted from pump.fun creation events."""
     name: str
@@ -43,8 +44,20 @@ class TokenInfo:
     creator_vault: Pubkey
     signature: str
 
+    # Base58 forms of the pubkeys, encoded once at construction
+    mint_str: str = field(init=False, repr=False)
+    creator_str: str = field(init=False, repr=False)
+    bonding_curve_str: str = field(init=False, repr=False)
+    associated_bonding_curve_str: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.mint_str = str(self.mint)
+        self.creator_str = str(self.creator)
+        self.bonding_curve_str = str(self.bonding_curve)
+        self.associated_bonding_curve_str = str(self.associated_bonding_curve)
+
     def __str__(self):
-        return f"{self.name} ({self.symbol}) - Mint: {self.mint}"
+        return f"{self.name} ({self.symbol}) - Mint: {self.mint_str}"
 
 class PumpMonitor:
     """Monitors pump.fun for new token launches using logsSubscribe."""
@@ -83,15 +96,15 @@ class PumpMonitor:
                             if not token_info:
                                 continue
 
-                            logger.info(f"New token detected: {token_info}")
+                            logger.info("New token detected: %s", token_info)
 
                             # Apply filters
                             if match_string and not self._matches_filter(token_info, match_string):
-                                logger.info(f"Token does not match filter '{match_string}'. Skipping...")
+                                logger.info("Token does not match filter '%s'. Skipping...", match_string)
                                 continue
 
                             if creator_address and str(token_info.user) != creator_address:
-                                logger.info(f"Token not created by {creator_address}. Skipping...")
+                                logger.info("Token not created by %s. Skipping...", creator_address)
                                 continue
 
                             await token_callback(token_info)
@@ -173,7 +186,7 @@ class PumpMonitor:
             logger.warning("WebSocket connection closed")
             raise
         except Exception as e:
-            logger.error(f"Error processing WebSocket message: {str(e)}")
+            logger.error("Error processing WebSocket message: %s", e)
 
         return None
 
@@ -196,10 +209,10 @@ class PumpMonitor:
                     parsed_data = self._parse_create_instruction(decoded_data)
 
                     if parsed_data and "name" in parsed_data:
-                        mint = Pubkey.from_string(parsed_data["mint"])
-                        bonding_curve = Pubkey.from_string(parsed_data["bondingCurve"])
+                        mint = parsed_data["mint"]
+                        bonding_curve = parsed_data["bondingCurve"]
                         associated_curve = self._find_associated_bonding_curve(mint, bonding_curve)
-                        creator = Pubkey.from_string(parsed_data["creator"])
+                        creator = parsed_data["creator"]
                         creator_vault = self._find_creator_vault(creator)
 
                         return TokenInfo(
@@ -209,27 +222,33 @@ class PumpMonitor:
                             mint=mint,
                             bonding_curve=bonding_curve,
                             associated_bonding_curve=associated_curve,
-                            user=Pubkey.from_string(parsed_data["user"]),
+                            user=parsed_data["user"],
                             creator=creator,
                             creator_vault=creator_vault,
                             signature=signature,
                         )
                 except Exception as e:
-                    logger.error(f"Failed to process log data: {e}")
+                    logger.error("Failed to process log data: %s", e)
 
         return None
 
     def _parse_create_instruction(self, data: bytes) -> Optional[dict]:
-        """Parse the create instruction data from pump.fun."""
+        """Parse the create instruction data from pump.fun.
+
+        Public key fields are returned as ``Pubkey`` objects built straight from
+        the raw 32 bytes, so no base58 round trip happens during parsing.
+        """
         if len(data) < 8:
             return None
 
-        # Check for the correct instruction discriminator
-        discriminator = struct.unpack("<Q", data[:8])[0]
-        if discriminator != CREATE_DISCRIMINATOR:
-            logger.debug(f"Skipping non-Create instruction with discriminator: {discriminator}")
+        # Check for the correct instruction discriminator (raw bytes compare, no unpack)
+        if data[:8] != _CREATE_DISC_BYTES:
+            if logger.isEnabledFor(logging.DEBUG):
+                discriminator = struct.unpack("<Q", data[:8])[0]
+                logger.debug("Skipping non-Create instruction with discriminator: %d", discriminator)
             return None
 
+        mv = memoryview(data)
         offset = 8
         parsed_data = {}
 
@@ -247,19 +266,19 @@ class PumpMonitor:
         try:
             for field_name, field_type in fields:
                 if field_type == "string":
-                    length = struct.unpack("<I", data[offset : offset + 4])[0]
+                    length = _U32.unpack_from(mv, offset)[0]
                     offset += 4
-                    value = data[offset : offset + length].decode("utf-8")
+                    value = str(mv[offset : offset + length], "utf-8")
                     offset += length
                 elif field_type == "publicKey":
-                    value = base58.b58encode(data[offset : offset + 32]).decode("utf-8")
+                    value = Pubkey.from_bytes(bytes(mv[offset : offset + 32]))
                     offset += 32
 
                 parsed_data[field_name] = value
 
             return parsed_data
         except Exception as e:
-            logger.error(f"Failed to parse create instruction: {e}")
+            logger.error("Failed to parse create instruction: %s", e)
             return None
 
     def _find_associated_bonding_curve(self, mint: Pubkey, bonding_curve: Pubkey) -> Pubkey:
@@ -1,35 +1,60 @@
 """
 Rolling stats module for tracking per-mint activity over 10-minute windows.
-Uses dict + deque for efficient time-based pruning without external dependencies.
+Uses an LRU-bounded OrderedDict + deque for efficient time-based pruning without external dependencies.
 """
 
-from collections import deque, defaultdict
+from collections import deque, OrderedDict
 import statistics
 import time
 
 
 class RollingStats:
-    def __init__(self, window_ms=600000):  # 10 minutes default
+    def __init__(self, window_ms=600000, max_mints=10000):  # 10 minutes default
         self.window_ms = window_ms
-        self.mint_data = defaultdict(lambda: {
-            'swaps': deque(),
-            'lp_additions': deque()
-        })
+        self.max_mints = max_mints
+        # LRU of active mints: most recently touched mint is kept at the end
+        self.mint_data = OrderedDict()
+    
+    def _touch(self, mint):
+        """Get (or create) the entry for a mint and mark it most recently used"""
+        entry = self.mint_data.get(mint)
+        if entry is None:
+            entry = {
+                'swaps': deque(),
+                'lp_additions': deque()
+            }
+            self.mint_data[mint] = entry
+            
+            # Evict the coldest mint when over capacity
+            if len(self.mint_data) > self.max_mints:
+                self.mint_data.popitem(last=False)
+        else:
+            self.mint_data.move_to_end(mint)
+        
+        return entry
     
     def _prune_old_entries(self, mint):
         """Remove entries older than window_ms"""
+        entry = self.mint_data.get(mint)
+        if entry is None:
+            return
+        
         current_time = int(time.time() * 1000)
         cutoff_time = current_time - self.window_ms
         
         # Prune swaps
-        while (self.mint_data[mint]['swaps'] and 
-               self.mint_data[mint]['swaps'][0]['ms'] < cutoff_time):
-            self.mint_data[mint]['swaps'].popleft()
+        swaps = entry['swaps']
+        while swaps and swaps[0]['ms'] < cutoff_time:
+            swaps.popleft()
         
         # Prune LP additions
-        while (self.mint_data[mint]['lp_additions'] and 
-               self.mint_data[mint]['lp_additions'][0]['ms'] < cutoff_time):
-            self.mint_data[mint]['lp_additions'].popleft()
+        lp_additions = entry['lp_additions']
+        while lp_additions and lp_additions[0]['ms'] < cutoff_time:
+            lp_additions.popleft()
+        
+        # Drop mints whose window has fully drained
+        if not swaps and not lp_additions:
+            del self.mint_data[mint]
     
     def record_swap(self, mint, wallet, usd, is_buy, ms, is_mev=False):
         """Record a swap transaction"""
@@ -43,7 +68,7 @@ class RollingStats:
             'is_mev': is_mev
         }
         
-        self.mint_data[mint]['swaps'].append(swap_data)
+        self._touch(mint)['swaps'].append(swap_data)
     
     def record_lp(self, mint, usd, ms):
         """Record a liquidity provision"""
@@ -54,16 +79,15 @@ class RollingStats:
             'ms': ms
         }
         
-        self.mint_data[mint]['lp_additions'].append(lp_data)
+        self._touch(mint)['lp_additions'].append(lp_data)
     
     def get_stats(self, mint):
         """Get comprehensive stats for a mint over the rolling window"""
         self._prune_old_entries(mint)
         
-        swaps = list(self.mint_data[mint]['swaps'])
-        lp_additions = list(self.mint_data[mint]['lp_additions'])
+        entry = self.mint_data.get(mint)
         
-        if not swaps and not lp_additions:
+        if entry is None:
             return {
                 'unique_buyers': 0,
                 'tx_per_min': 0.0,
@@ -73,6 +97,9 @@ class RollingStats:
                 'mev_share': 0.0
             }
         
+        swaps = list(entry['swaps'])
+        lp_additions = list(entry['lp_additions'])
+        
         # Calculate unique buyers (only buy transactions)
         unique_buyers = len(set(swap['wallet'] for swap in swaps if swap['is_buy']))
         
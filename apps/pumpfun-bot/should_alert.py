@@ -5,188 +5,469 @@ Combines all filtering components to determine if a token should trigger webhook
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, Mapping, Optional
+
+import aiohttp
 from solana.rpc.async_api import AsyncClient
 
 # Import our filtering modules
-from wallet_analyzer import is_wallet_suspicious_async
+from wallet_analyzer import is_wallet_suspicious_async, is_wallet_suspicious_with, parse_signatures_response
 from symbol_validator import is_symbol_valid
-from liquidity_analyzer import get_initial_liquidity_async
+from liquidity_analyzer import (
+    get_initial_liquidity_async,
+    get_bonding_curve_address,
+    get_cached_liquidity,
+    cache_liquidity,
+    parse_bonding_curve_liquidity
+)
 from utils import (
     log_event,
-    get_config, 
     get_filtering_config,
-    get_blocked_creators,
-    calculate_quality_score
+    get_rpc_endpoints,
+    calculate_quality_score,
+    init_logging,
+    log_event_lazy
 )
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class FilterCfg:
+    """Immutable snapshot of the filtering configuration used by should_alert."""
+    min_liquidity_sol: float
+    min_wallet_age_minutes: int
+    min_wallet_transactions: int
+    wallet_analysis_timeout: int
+    min_symbol_length: int
+    max_symbol_length: int
+    require_uppercase_symbols: bool
+    enable_wallet_filter: bool
+    enable_symbol_filter: bool
+    enable_liquidity_filter: bool
+    enable_blocked_creator_filter: bool
+    blocked_creators: frozenset
+
+
+@dataclass(frozen=True, slots=True)
+class TokenMetadata:
+    """Token fields consumed by the alert filters (addresses as base58 strings)."""
+    symbol: str
+    creator: str
+    mint: str
+    name: str = 'Unknown'
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TokenMetadata":
+        """Build from a dict with 'symbol', 'creator', 'mint' and optional 'name' keys."""
+        return cls(
+            symbol=data.get('symbol', ''),
+            creator=data.get('creator', ''),
+            mint=data.get('mint', ''),
+            name=data.get('name', 'Unknown')
+        )
+    
+    @classmethod
+    def from_token_info(cls, token_info) -> "TokenMetadata":
+        """Build from a pump_monitor.TokenInfo."""
+        return cls(
+            symbol=token_info.symbol,
+            creator=token_info.creator_str,
+            mint=token_info.mint_str,
+            name=token_info.name
+        )
+
+
+def _load_filter_cfg(config: Mapping[str, Any]) -> FilterCfg:
+    """Build a FilterCfg from a get_filtering_config() mapping."""
+    return FilterCfg(
+        min_liquidity_sol=config['min_liquidity_sol'],
+        min_wallet_age_minutes=config['min_wallet_age_minutes'],
+        min_wallet_transactions=config['min_wallet_transactions'],
+        wallet_analysis_timeout=config['wallet_analysis_timeout'],
+        min_symbol_length=config['min_symbol_length'],
+        max_symbol_length=config['max_symbol_length'],
+        require_uppercase_symbols=config['require_uppercase_symbols'],
+        enable_wallet_filter=config['enable_wallet_filter'],
+        enable_symbol_filter=config['enable_symbol_filter'],
+        enable_liquidity_filter=config['enable_liquidity_filter'],
+        enable_blocked_creator_filter=config['enable_blocked_creator_filter'],
+        blocked_creators=config['blocked_creators']
+    )
+
+
+# Last seen filtering config mapping and the FilterCfg built from it
+_filter_cfg_cache: tuple = (None, None)
+
+
+def get_filter_cfg() -> FilterCfg:
+    """
+    Get the filtering configuration as a FilterCfg.
+    
+    Built on first use rather than at import, so a .env loaded after importing
+    this module is still honoured. The snapshot is rebuilt only when
+    get_filtering_config() returns a new mapping, i.e. after refresh_config().
+    """
+    global _filter_cfg_cache
+    config = get_filtering_config()
+    
+    cached_config, cfg = _filter_cfg_cache
+    if config is cached_config:
+        return cfg
+    
+    cfg = _load_filter_cfg(config)
+    _filter_cfg_cache = (config, cfg)
+    return cfg
+
+
 def is_blocked_creator(creator_address: str) -> bool:
     """
     Check if a creator address is in the blocked list.
     
+    Uses the same FilterCfg snapshot as evaluate(), so both see a changed
+    BLOCKED_CREATORS at the same time (after refresh_config()).
+    
     Args:
         creator_address: The creator wallet address as string
         
     Returns:
         bool: True if creator is blocked, False otherwise
     """
-    blocked_creators = get_blocked_creators()
-    return creator_address in blocked_creators
+    return creator_address in get_filter_cfg().blocked_creators
 
 
-async def should_alert(token_metadata: Dict[str, Any], client: AsyncClient) -> bool:
+@dataclass(slots=True)
+class AlertEvaluation:
+    """Outcome of evaluate(): the alert decision plus per-check details."""
+    should_alert: bool
+    details: Dict[str, Any]
+
+
+async def evaluate(token: TokenMetadata, client: AsyncClient, *, verbose: bool = False) -> AlertEvaluation:
     """
-    Determine if a token should trigger a webhook alert based on all filtering criteria.
+    Run the alert filters for a token.
+    
+    By default checks short-circuit on the first failure, so a rejected token
+    never pays for the remaining (possibly RPC-backed) checks. With
+    verbose=True every enabled check runs so the details explain all
+    rejection reasons. Approved tokens always have run every check.
     
     Args:
-        token_metadata: Dictionary containing token information with keys:
-            - 'symbol': Token symbol (string)
-            - 'creator': Creator wallet address (string)
-            - 'mint': Token mint address (string)
-            - 'name': Token name (optional, for logging)
+        token: Token to evaluate (see TokenMetadata.from_dict / from_token_info)
         client: Solana RPC client for wallet analysis
+        verbose: Run all checks even after a failure
         
     Returns:
-        bool: True if token should trigger alert, False if it should be skipped
+        AlertEvaluation: Decision and details ('checks', 'details', 'rejection_reasons')
     """
-    # Extract required fields
-    symbol = token_metadata.get('symbol', '')
-    creator = token_metadata.get('creator', '')
-    mint = token_metadata.get('mint', '')
-    name = token_metadata.get('name', 'Unknown')
+    symbol = token.symbol
+    creator = token.creator
+    mint = token.mint
+    name = token.name
     
-    # Get filtering configuration
-    config = get_filtering_config()
+    config = get_filter_cfg()
+    
+    # Disabled checks count as passed
+    checks = {
+        'symbol_valid': True,
+        'creator_not_blocked': True,
+        'liquidity_sufficient': True,
+        'wallet_not_suspicious': True
+    }
+    details = {
+        'should_alert': False,
+        'token_name': name,
+        'token_symbol': symbol,
+        'checks': checks,
+        'details': {},
+        'rejection_reasons': []
+    }
+    reasons = details['rejection_reasons']
     
-    log_event(f"Evaluating alert criteria for: {name} ({symbol})")
+    log_event_lazy("Evaluating alert criteria for: %s (%s)", name, symbol)
     
     try:
-        # FAST CHECKS FIRST (no API calls) - reordered for efficiency
+        # Checks are ordered by cost: instant local checks first, then the
+        # single liquidity lookup, and the multi-call wallet analysis last
         
         # Check 1: Symbol validation (if enabled) - instant check
-        if config['enable_symbol_filter']:
+        if config.enable_symbol_filter:
             if not is_symbol_valid(symbol):
+                checks['symbol_valid'] = False
+                reasons.append(f"Invalid symbol: {symbol}")
                 log_event(f"Skipping {name}: Invalid symbol '{symbol}'", 'warning')
-                return False
-            log_event(f"Symbol check passed: {symbol}", 'debug')
+                if not verbose:
+                    return AlertEvaluation(False, details)
+            else:
+                logger.debug("Symbol check passed: %s", symbol)
         
         # Check 2: Blocked creator (if enabled) - instant check
-        if config['enable_blocked_creator_filter']:
-            if is_blocked_creator(creator):
+        if config.enable_blocked_creator_filter:
+            if creator in config.blocked_creators:
+                checks['creator_not_blocked'] = False
+                reasons.append(f"Blocked creator: {creator}")
                 log_event(f"Skipping {name}: Blocked creator {creator}", 'warning')
-                return False
-            log_event(f"Creator not blocked: {creator}", 'debug')
+                if not verbose:
+                    return AlertEvaluation(False, details)
+            else:
+                logger.debug("Creator not blocked: %s", creator)
         
         # SLOW CHECKS (API calls) - only if fast checks pass
         
-        # Check 3: Wallet suspicious check (if enabled) - requires API calls
-        if config['enable_wallet_filter']:
+        # Check 3: Liquidity check (if enabled) - single lookup, frequently rejects
+        if config.enable_liquidity_filter:
+            liquidity_sol = await get_initial_liquidity_async(mint)
+            details['details']['liquidity_sol'] = liquidity_sol
+            if liquidity_sol < config.min_liquidity_sol:
+                checks['liquidity_sufficient'] = False
+                reasons.append(f"Low liquidity: {liquidity_sol:.4f} SOL")
+                log_event(f"Skipping {name}: Low liquidity {liquidity_sol:.4f} SOL", 'warning')
+                if not verbose:
+                    return AlertEvaluation(False, details)
+            else:
+                logger.debug("Liquidity check passed: %.4f SOL", liquidity_sol)
+        
+        # Check 4: Wallet suspicious check (if enabled) - most expensive, multiple API calls
+        if config.enable_wallet_filter:
             if await is_wallet_suspicious_async(creator, client):
+                checks['wallet_not_suspicious'] = False
+                reasons.append(f"Suspicious wallet: {creator}")
                 log_event(f"Skipping {name}: Suspicious wallet {creator}", 'warning')
-                return False
-            log_event(f"Wallet check passed: {creator}", 'debug')
+                if not verbose:
+                    return AlertEvaluation(False, details)
+            else:
+                logger.debug("Wallet check passed: %s", creator)
         
-        # Check 4: Liquidity check (if enabled) - requires API calls
-        if config['enable_liquidity_filter']:
-            liquidity_sol = await get_initial_liquidity_async(mint)
-            if liquidity_sol < config['min_liquidity_sol']:
-                log_event(f"Skipping {name}: Low liquidity {liquidity_sol:.4f} SOL", 'warning')
-                return False
-            log_event(f"Liquidity check passed: {liquidity_sol:.4f} SOL", 'debug')
+        details['should_alert'] = all(checks.values())
+        if details['should_alert']:
+            log_event(f"ALERT APPROVED: {name} ({symbol}) passed all filters")
         
-        # All checks passed
-        log_event(f"ALERT APPROVED: {name} ({symbol}) passed all filters")
-        return True
+        return AlertEvaluation(details['should_alert'], details)
         
     except Exception as e:
         log_event(f"Error evaluating {name}: {e}", 'error')
+        reasons.append(f"Evaluation error: {str(e)}")
         # In case of error, default to not alerting to avoid spam
-        return False
+        details['should_alert'] = False
+        return AlertEvaluation(False, details)
 
 
-async def should_alert_with_details(token_metadata: Dict[str, Any], client: AsyncClient) -> Dict[str, Any]:
+async def should_alert(token: TokenMetadata, client: AsyncClient) -> bool:
     """
-    Enhanced version that returns detailed results for each check.
+    Determine if a token should trigger a webhook alert based on all filtering criteria.
     
     Args:
-        token_metadata: Dictionary containing token information
-        client: Solana RPC client
+        token: Token to evaluate (see TokenMetadata.from_dict / from_token_info)
+        client: Solana RPC client for wallet analysis
         
     Returns:
-        dict: Detailed results including pass/fail for each check
+        bool: True if token should trigger alert, False if it should be skipped
     """
-    symbol = token_metadata.get('symbol', '')
-    creator = token_metadata.get('creator', '')
-    mint = token_metadata.get('mint', '')
-    name = token_metadata.get('name', 'Unknown')
+    return (await evaluate(token, client)).should_alert
+
+
+async def _post_rpc_batch(session: aiohttp.ClientSession, requests: list) -> Dict[Any, Any]:
+    """
+    Send several JSON-RPC requests as one batch POST.
     
-    result = {
+    Args:
+        session: Shared aiohttp session
+        requests: JSON-RPC request objects, each with a unique 'id'
+        
+    Returns:
+        dict: Responses keyed by request id (batch responses may arrive in any order)
+    """
+    rpc_url = get_rpc_endpoints()['http']
+    async with session.post(rpc_url, json=requests) as response:
+        response.raise_for_status()
+        responses = await response.json()
+    
+    if not isinstance(responses, list):
+        raise ValueError(f"Unexpected batch response: {responses}")
+    
+    return {item.get('id'): item for item in responses}
+
+
+async def evaluate_batched(token: TokenMetadata, session: aiohttp.ClientSession) -> AlertEvaluation:
+    """
+    Variant of evaluate() that fetches all on-chain data in a single round trip.
+    
+    On a wallet cache miss the wallet history (getSignaturesForAddress) and the
+    bonding curve account (getAccountInfo) are requested together as one
+    JSON-RPC batch. The wallet verdict goes through wallet_analyzer's caches,
+    in-flight coalescing and rate limit, with the same thresholds as evaluate().
+    Liquidity is the bonding curve's virtual SOL reserves, the figure the
+    pump.fun API reports, decoded from the account since that API is not
+    JSON-RPC and cannot join the batch. Once the data is back every enabled
+    check runs, so the details explain all rejection reasons.
+    
+    Args:
+        token: Token to evaluate (see TokenMetadata.from_dict / from_token_info)
+        session: Shared aiohttp session used for the batch POST
+        
+    Returns:
+        AlertEvaluation: Decision and details in the same shape as evaluate()
+    """
+    symbol = token.symbol
+    creator = token.creator
+    mint = token.mint
+    name = token.name
+    
+    config = get_filter_cfg()
+    
+    # Disabled checks count as passed
+    checks = {
+        'symbol_valid': True,
+        'creator_not_blocked': True,
+        'liquidity_sufficient': True,
+        'wallet_not_suspicious': True
+    }
+    details = {
         'should_alert': False,
         'token_name': name,
         'token_symbol': symbol,
-        'checks': {
-            'symbol_valid': False,
-            'creator_not_blocked': False,
-            'wallet_not_suspicious': False,
-            'liquidity_sufficient': False
-        },
+        'checks': checks,
         'details': {},
         'rejection_reasons': []
     }
+    reasons = details['rejection_reasons']
+    
+    log_event_lazy("Evaluating alert criteria (batched) for: %s (%s)", name, symbol)
     
     try:
-        # Symbol validation
-        result['checks']['symbol_valid'] = is_symbol_valid(symbol)
-        if not result['checks']['symbol_valid']:
-            result['rejection_reasons'].append(f"Invalid symbol: {symbol}")
+        # Fast filters stay outside the batch so they short-circuit without any I/O
+        if config.enable_symbol_filter and not is_symbol_valid(symbol):
+            checks['symbol_valid'] = False
+            reasons.append(f"Invalid symbol: {symbol}")
+            log_event(f"Skipping {name}: Invalid symbol '{symbol}'", 'warning')
+            return AlertEvaluation(False, details)
+        
+        if config.enable_blocked_creator_filter and creator in config.blocked_creators:
+            checks['creator_not_blocked'] = False
+            reasons.append(f"Blocked creator: {creator}")
+            log_event(f"Skipping {name}: Blocked creator {creator}", 'warning')
+            return AlertEvaluation(False, details)
+        
+        liquidity_sol = None
+        liquidity_request = None
+        if config.enable_liquidity_filter:
+            liquidity_sol = get_cached_liquidity(mint)
+            if liquidity_sol is None:
+                liquidity_request = {
+                    'jsonrpc': '2.0',
+                    'id': 'bonding_curve',
+                    'method': 'getAccountInfo',
+                    'params': [str(get_bonding_curve_address(mint)), {'encoding': 'base64', 'commitment': 'confirmed'}]
+                }
+        
+        responses: Dict[Any, Any] = {}
+        
+        async def fetch_signatures() -> list:
+            # Only runs on a wallet cache miss; the bonding curve lookup rides along
+            batch = [{
+                'jsonrpc': '2.0',
+                'id': 'signatures',
+                'method': 'getSignaturesForAddress',
+                'params': [creator, {'limit': 10, 'commitment': 'confirmed'}]
+            }]
+            if liquidity_request is not None:
+                batch.append(liquidity_request)
+            responses.update(await _post_rpc_batch(session, batch))
+            return parse_signatures_response(responses.get('signatures'))
         
-        # Blocked creator check
-        result['checks']['creator_not_blocked'] = not is_blocked_creator(creator)
-        if not result['checks']['creator_not_blocked']:
-            result['rejection_reasons'].append(f"Blocked creator: {creator}")
+        creator_suspicious = False
+        if config.enable_wallet_filter:
+            creator_suspicious = await is_wallet_suspicious_with(creator, fetch_signatures)
         
-        # Wallet analysis
-        result['checks']['wallet_not_suspicious'] = not await is_wallet_suspicious_async(creator, client)
-        if not result['checks']['wallet_not_suspicious']:
-            result['rejection_reasons'].append(f"Suspicious wallet: {creator}")
+        if liquidity_request is not None:
+            if 'bonding_curve' not in responses:
+                # Wallet verdict was cached (or shared), so nothing was batched
+                responses.update(await _post_rpc_batch(session, [liquidity_request]))
+            
+            account = (responses.get('bonding_curve') or {}).get('result') or {}
+            liquidity_sol = parse_bonding_curve_liquidity(account.get('value'))
+            if liquidity_sol > 0:
+                cache_liquidity(mint, liquidity_sol)
+        
+        if liquidity_sol is not None:
+            details['details']['liquidity_sol'] = liquidity_sol
+            if liquidity_sol < config.min_liquidity_sol:
+                checks['liquidity_sufficient'] = False
+                reasons.append(f"Low liquidity: {liquidity_sol:.4f} SOL")
+                log_event(f"Skipping {name}: Low liquidity {liquidity_sol:.4f} SOL", 'warning')
         
-        # Liquidity check
-        liquidity_sol = await get_initial_liquidity_async(mint)
-        result['details']['liquidity_sol'] = liquidity_sol
-        result['checks']['liquidity_sufficient'] = liquidity_sol >= 0.1
-        if not result['checks']['liquidity_sufficient']:
-            result['rejection_reasons'].append(f"Low liquidity: {liquidity_sol:.4f} SOL")
+        if creator_suspicious:
+            checks['wallet_not_suspicious'] = False
+            reasons.append(f"Suspicious wallet: {creator}")
+            log_event(f"Skipping {name}: Suspicious wallet {creator}", 'warning')
         
-        # Overall decision
-        result['should_alert'] = all(result['checks'].values())
+        details['should_alert'] = all(checks.values())
+        if details['should_alert']:
+            log_event(f"ALERT APPROVED: {name} ({symbol}) passed all filters")
         
-        return result
+        return AlertEvaluation(details['should_alert'], details)
         
     except Exception as e:
-        logger.error(f"Error in detailed evaluation for {name}: {e}")
-        result['rejection_reasons'].append(f"Evaluation error: {str(e)}")
-        return result
+        log_event(f"Error evaluating {name}: {e}", 'error')
+        reasons.append(f"Evaluation error: {str(e)}")
+        # In case of error, default to not alerting to avoid spam
+        details['should_alert'] = False
+        return AlertEvaluation(False, details)
+
+
+async def should_alert_batched(token: TokenMetadata, session: aiohttp.ClientSession) -> bool:
+    """
+    Variant of should_alert that fetches all on-chain data in a single round trip.
+    
+    See evaluate_batched for how the checks are batched.
+    
+    Args:
+        token: Token to evaluate
+        session: Shared aiohttp session used for the batch POST
+        
+    Returns:
+        bool: True if token should trigger alert, False if it should be skipped
+    """
+    return (await evaluate_batched(token, session)).should_alert
+
+
+async def should_alert_with_details(token: TokenMetadata, client: AsyncClient) -> Dict[str, Any]:
+    """
+    Enhanced version that returns detailed results for each check.
+    
+    Equivalent to evaluate(token, client, verbose=True).details.
+    
+    Args:
+        token: Token to evaluate
+        client: Solana RPC client
+        
+    Returns:
+        dict: Detailed results including pass/fail for each check
+    """
+    return (await evaluate(token, client, verbose=True)).details
 
 
 # Synchronous wrapper for compatibility
-def should_alert_sync(token_metadata: Dict[str, Any], client: AsyncClient) -> bool:
+def should_alert_sync(token: TokenMetadata, client: AsyncClient) -> bool:
     """
     Synchronous wrapper for should_alert function.
     
-    Note: This creates a new event loop if none exists.
-    For async contexts, use should_alert() directly.
+    Runs should_alert() on a fresh event loop via asyncio.run(). Must not be
+    called from a running event loop - use should_alert() directly there.
+    
+    Raises:
+        RuntimeError: If called while an event loop is already running
     """
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If we're already in an async context, we can't use run_until_complete
-            logger.warning("Cannot run sync version in async context - use should_alert() instead")
-            return False
-        else:
-            return loop.run_until_complete(should_alert(token_metadata, client))
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("should_alert_sync() called from a running event loop - await should_alert() instead")
+    
+    try:
+        return asyncio.run(should_alert(token, client))
     except Exception as e:
         logger.error(f"Error in should_alert_sync: {e}")
         return False
@@ -250,16 +531,26 @@ async def test_should_alert():
         approved_count = 0
         rejected_count = 0
         
-        for token in test_tokens:
-            print(f"\n📍 Testing: {token['name']} ({token['symbol']})")
+        tokens = [TokenMetadata.from_dict(token_dict) for token_dict in test_tokens]
+        
+        # Evaluations are independent and network-bound, so run them concurrently;
+        # one verbose evaluation gives both the decision and every rejection reason
+        results = await asyncio.gather(
+            *(evaluate(token, client, verbose=True) for token in tokens),
+            return_exceptions=True
+        )
+        
+        for token, evaluation in zip(tokens, results):
+            print(f"\n📍 Testing: {token.name} ({token.symbol})")
             
-            # Test basic function
-            should_send_alert = await should_alert(token, client)
+            if isinstance(evaluation, Exception):
+                rejected_count += 1
+                print(f"   ❌ ERROR - {evaluation}")
+                continue
             
-            # Test detailed function
-            detailed_result = await should_alert_with_details(token, client)
+            detailed_result = evaluation.details
             
-            if should_send_alert:
+            if evaluation.should_alert:
                 approved_count += 1
                 print(f"   ✅ APPROVED - Alert would be sent")
                 print(f"   Liquidity: {detailed_result['details'].get('liquidity_sol', 'N/A')} SOL")
@@ -278,4 +569,5 @@ async def test_should_alert():
 
 
 if __name__ == "__main__":
+    init_logging()
     asyncio.run(test_should_alert())
\ No newline at end of file
@@ -6,6 +6,9 @@ Validates token symbols to filter out invalid or suspicious symbols.
 import re
 from typing import Optional
 
+# Compiled once at import; bound method avoids an attribute lookup per call
+_SYMBOL_FULLMATCH = re.compile(r'[A-Z]{2,6}').fullmatch
+
 
 def is_symbol_valid(symbol: str) -> bool:
     """
@@ -27,9 +30,8 @@ def is_symbol_valid(symbol: str) -> bool:
     if not symbol:
         return False
     
-    # Use regex to validate: exactly 2-6 uppercase letters A-Z only
-    pattern = r'^[A-Z]{2,6}$'
-    return bool(re.match(pattern, symbol))
+    # Exactly 2-6 uppercase letters A-Z only
+    return _SYMBOL_FULLMATCH(symbol) is not None
 
 
 def get_symbol_issues(symbol: str) -> list[str]:
@@ -7,7 +7,7 @@ This script validates webhook delivery without waiting for real tokens.
 import asyncio
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 from dotenv import load_dotenv
 from solders.pubkey import Pubkey
@@ -89,9 +89,8 @@ async def test_webhook_delivery():
     # Create test bot (no need for real WebSocket endpoint for testing)
     bot = WebhookAlertBot("wss://test.endpoint", config)
     
-    # Initialize session
-    import aiohttp
-    bot.session = aiohttp.ClientSession()
+    # Initialize session (same pooling and timeout as bot.start())
+    bot.session = bot.create_session()
     
     try:
         # Create test token info
@@ -105,7 +104,7 @@ async def test_webhook_delivery():
         
         # Send test webhook
         print(f"\n📤 Sending test webhook...")
-        await bot._send_webhook_alert(test_token)
+        await bot._send_webhook_alert(test_token, datetime.now(timezone.utc))
         
         # Check results
         stats = bot.get_stats()
@@ -124,6 +123,7 @@ async def test_webhook_formats():
     print("\n🎨 Testing webhook message formats...")
     
     test_token = create_test_token_info()
+    now_dt = datetime.now(timezone.utc)
     
     # Test Telegram format
     dummy_config = WebhookConfig(
@@ -132,14 +132,13 @@ async def test_webhook_formats():
         telegram_chat_id="123456789"
     )
     bot = WebhookAlertBot("wss://test", dummy_config)
-    telegram_msg = bot._format_telegram_message(test_token)
+    telegram_msg = bot._format_telegram_message(test_token, now_dt)
     
     print("\n📱 Telegram message format:")
     print(telegram_msg["text"])
     
     # Test Discord format
-    dummy_config.webhook_type = "discord"
-    discord_msg = bot._format_discord_message(test_token)
+    discord_msg = bot._format_discord_message(test_token, now_dt)
     
     print("\n💬 Discord embed format:")
     print(f"Title: {discord_msg['embeds'][0]['title']}")
@@ -147,8 +146,7 @@ async def test_webhook_formats():
         print(f"  {field['name']}: {field['value']}")
     
     # Test Generic format
-    dummy_config.webhook_type = "generic"
-    generic_msg = bot._format_generic_message(test_token)
+    generic_msg = bot._format_generic_message(test_token, now_dt)
     
     print("\n🌐 Generic JSON format:")
     import json
@@ -5,25 +5,43 @@ Centralized helper functions for logging, API calls, and configuration managemen
 
 import os
 import time
+import atexit
 import json
+import random
 import logging
+import orjson
 import requests
-from datetime import datetime
-from typing import Any, Dict, Optional, List, Union
-from functools import wraps
+import aiohttp
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, List, Union
+from functools import wraps, cache
 import asyncio
 
+_logger = logging.getLogger(__name__)
+_LOG_LEVELS = logging.getLevelNamesMapping()
+
+
+def _read_memory_api_flag() -> bool:
+    """Read LOG_TO_MEMORY_API from the environment."""
+    return os.getenv('LOG_TO_MEMORY_API', 'false').lower() == 'true'
+
+
+# Read once instead of per log line; refreshed by init_logging()/refresh_config()
+_MEMORY_API_ENABLED = _read_memory_api_flag()
+
+
 # Configure logging format from environment
 def setup_logging():
     """Setup standardized logging configuration."""
     log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
     bot_id = os.getenv('BOT_IDENTIFIER', 'BOT1')
     
-    # Create custom formatter
-    class BotFormatter(logging.Formatter):
-        def format(self, record):
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            return f"[{timestamp}] {bot_id}: {record.getMessage()}"
+    # Standard formatter; asctime is only rendered for records that are emitted.
+    # A literal '%' in the identifier must not be read as a format directive.
+    formatter = logging.Formatter(
+        fmt=f"[%(asctime)s] {bot_id.replace('%', '%%')}: %(message)s",
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
     
     # Configure root logger
     logging.basicConfig(
@@ -35,9 +53,33 @@ def setup_logging():
         ]
     )
     
-    # Apply custom formatter to all handlers
+    # Apply formatter to all handlers
     for handler in logging.getLogger().handlers:
-        handler.setFormatter(BotFormatter())
+        handler.setFormatter(formatter)
+
+
+_logging_initialized = False
+
+
+def init_logging() -> None:
+    """
+    Configure logging and log the startup banner.
+    
+    Called explicitly by entry points so that importing utils has no side
+    effects (no handlers installed, no pump_bot.log opened). Safe to call
+    more than once.
+    """
+    global _logging_initialized, _MEMORY_API_ENABLED
+    if _logging_initialized:
+        return
+    _logging_initialized = True
+    
+    setup_logging()
+    _MEMORY_API_ENABLED = _read_memory_api_flag()
+    
+    # Log startup
+    bot_info = get_bot_info()
+    log_event(f"Utils module initialized - {bot_info['identifier']} v{bot_info['version']}")
 
 
 def log_event(msg: str, level: str = 'info') -> None:
@@ -48,43 +90,131 @@ def log_event(msg: str, level: str = 'info') -> None:
         msg: Message to log
         level: Log level ('info', 'warning', 'error', 'debug')
     """
-    logger = logging.getLogger(__name__)
-    
     # Log locally
-    log_func = getattr(logger, level.lower(), logger.info)
+    log_func = getattr(_logger, level.lower(), _logger.info)
     log_func(msg)
     
     # Optionally log to memory API
-    if os.getenv('LOG_TO_MEMORY_API', 'false').lower() == 'true':
+    if _MEMORY_API_ENABLED:
         try:
             log_data = {
                 'timestamp': time.time(),
-                'bot_id': os.getenv('BOT_IDENTIFIER', 'BOT1'),
+                'bot_id': get_bot_info()['identifier'],
                 'level': level.upper(),
                 'message': msg
             }
             
-            base_url = os.getenv('MEMORY_API_BASE_URL', 'https://pump-memory-server.replit.app')
-            endpoint = os.getenv('MEMORY_LOGS_ENDPOINT', '/logs')
-            
-            # Use fire-and-forget for log posting to avoid blocking
-            asyncio.create_task(_post_log_async(f"{base_url}{endpoint}", log_data))
+            # Queue for the background shipper instead of posting inline
+            _enqueue_memory_log(log_data)
             
         except Exception as e:
             # Don't let log posting failures break the main flow
             pass
 
 
-async def _post_log_async(url: str, data: Dict[str, Any]) -> None:
-    """Async helper to post logs to memory API without blocking."""
+def log_event_lazy(fmt: str, *args: Any, level: str = 'info') -> None:
+    """
+    Like log_event, but only builds the message if something will consume it.
+    
+    Args:
+        fmt: %-style format string
+        *args: Values substituted into fmt
+        level: Log level ('info', 'warning', 'error', 'debug')
+    """
+    if not _MEMORY_API_ENABLED and not _logger.isEnabledFor(_LOG_LEVELS.get(level.upper(), logging.INFO)):
+        return
+    log_event(fmt % args if args else fmt, level)
+
+
+# Bodies are pre-serialized with orjson, so the content type is set explicitly
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+# Bounded queue + single background consumer that ships logs in batches
+_LOG_QUEUE_MAXSIZE = 4096
+_LOG_BATCH_SIZE = 32
+_log_queue: Optional[asyncio.Queue] = None
+_log_consumer_task: Optional[asyncio.Task] = None
+_log_queue_stats = {'queued': 0, 'dropped': 0}
+
+
+def _enqueue_memory_log(log_data: Dict[str, Any]) -> None:
+    """Queue a log entry for the memory API, dropping it if it can't be shipped."""
+    global _log_queue, _log_consumer_task
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop to ship from (sync caller)
+        _log_queue_stats['dropped'] += 1
+        return
+    
+    # Start the consumer lazily on the running loop
+    if _log_consumer_task is None or _log_consumer_task.done():
+        _log_queue = asyncio.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
+        _log_consumer_task = asyncio.create_task(_log_consumer(_log_queue))
+    
+    try:
+        _log_queue.put_nowait(log_data)
+        _log_queue_stats['queued'] += 1
+    except asyncio.QueueFull:
+        _log_queue_stats['dropped'] += 1
+
+
+def _memory_logs_url() -> str:
+    """Build the memory API URL that log batches are posted to."""
+    base_url = os.getenv('MEMORY_API_BASE_URL', 'https://pump-memory-server.replit.app')
+    endpoint = os.getenv('MEMORY_LOGS_ENDPOINT', '/logs')
+    return f"{base_url}{endpoint}"
+
+
+async def _log_consumer(queue: asyncio.Queue) -> None:
+    """Drain the log queue, posting up to _LOG_BATCH_SIZE entries per request."""
+    url = _memory_logs_url()
+    
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _LOG_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        
+        await _post_log_async(url, batch)
+
+
+async def _stop_log_consumer() -> None:
+    """Stop the log consumer, posting anything still queued first."""
+    global _log_consumer_task
+    task = _log_consumer_task
+    _log_consumer_task = None
+    if task is None or task.done():
+        return
+    
+    pending = []
+    while not _log_queue.empty():
+        pending.append(_log_queue.get_nowait())
+    
+    task.cancel()
     try:
-        timeout = int(os.getenv('DEFAULT_REQUEST_TIMEOUT', '5'))
-        async with asyncio.timeout(timeout):
-            # Use aiohttp if available, otherwise skip
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=data) as response:
-                    pass  # Fire and forget
+        await task
+    except asyncio.CancelledError:
+        pass
+    
+    url = _memory_logs_url()
+    for i in range(0, len(pending), _LOG_BATCH_SIZE):
+        await _post_log_async(url, pending[i:i + _LOG_BATCH_SIZE])
+
+
+def get_log_queue_stats() -> Dict[str, int]:
+    """Get counters for log entries queued for and dropped from memory API shipping."""
+    return dict(_log_queue_stats)
+
+
+async def _post_log_async(url: str, data: List[Dict[str, Any]]) -> None:
+    """Async helper to post a batch of logs to memory API without blocking."""
+    try:
+        # Bounded by the shared session's ClientTimeout; the context manager
+        # only returns the connection to the pool
+        async with get_memory_session().post(url, data=orjson.dumps(data), headers=_JSON_HEADERS):
+            pass  # Fire and forget
     except Exception:
         pass  # Silent failure for logging
 
@@ -117,20 +247,39 @@ def get_config(key: str, default: Any = None, cast_type: type = str) -> Any:
         return cast_type(value)
 
 
-def get_blocked_creators() -> set:
-    """Get blocked creator addresses from environment configuration."""
+# Last seen BLOCKED_CREATORS value and its parsed form
+_blocked_creators_cache: tuple = (None, frozenset())
+
+
+def get_blocked_creators() -> frozenset:
+    """
+    Get blocked creator addresses from environment configuration.
+    
+    The env value is only re-parsed when it changes; otherwise the
+    previously built frozenset is returned as is.
+    """
+    global _blocked_creators_cache
     blocked_str = os.getenv('BLOCKED_CREATORS', '')
-    if not blocked_str.strip():
-        return set()
     
-    # Split by comma and clean whitespace
-    addresses = [addr.strip() for addr in blocked_str.split(',') if addr.strip()]
-    return set(addresses)
+    cached_str, cached_set = _blocked_creators_cache
+    if blocked_str == cached_str:
+        return cached_set
+    
+    # Split by comma and clean whitespace once, at ingest
+    addresses = frozenset(addr.strip() for addr in blocked_str.split(',') if addr.strip())
+    _blocked_creators_cache = (blocked_str, addresses)
+    return addresses
 
 
-def get_filtering_config() -> Dict[str, Any]:
-    """Get all filtering configuration from environment."""
-    return {
+@cache
+def get_filtering_config() -> Mapping[str, Any]:
+    """
+    Get all filtering configuration from environment.
+    
+    The environment is read on first call and the result is cached as a
+    read-only mapping; call refresh_config() to pick up changes.
+    """
+    return MappingProxyType({
         'min_liquidity_sol': get_config('MIN_LIQUIDITY_SOL', 0.1, float),
         'min_wallet_age_minutes': get_config('MIN_WALLET_AGE_MINUTES', 15, int),
         'min_wallet_transactions': get_config('MIN_WALLET_TRANSACTIONS', 3, int),
@@ -143,27 +292,50 @@ def get_filtering_config() -> Dict[str, Any]:
         'enable_liquidity_filter': get_config('ENABLE_LIQUIDITY_FILTER', True, bool),
         'enable_blocked_creator_filter': get_config('ENABLE_BLOCKED_CREATOR_FILTER', True, bool),
         'blocked_creators': get_blocked_creators()
-    }
+    })
 
 
-def get_quality_scoring_config() -> Dict[str, float]:
-    """Get quality scoring configuration from environment."""
-    return {
+@cache
+def get_quality_scoring_config() -> Mapping[str, float]:
+    """Get quality scoring configuration from environment (cached, see refresh_config)."""
+    return MappingProxyType({
         'max_score': get_config('MAX_QUALITY_SCORE', 10.0, float),
         'low_liquidity_penalty': get_config('LOW_LIQUIDITY_PENALTY', 2.0, float),
         'medium_liquidity_penalty': get_config('MEDIUM_LIQUIDITY_PENALTY', 1.0, float),
         'medium_liquidity_threshold': get_config('MEDIUM_LIQUIDITY_THRESHOLD', 5.0, float)
-    }
+    })
 
 
-def retry_on_failure(max_retries: int = None, delay: float = None, backoff_multiplier: float = None):
+@cache
+def _quality_score_params() -> tuple:
+    """Quality scoring settings unpacked into a tuple for calculate_quality_score."""
+    config = get_quality_scoring_config()
+    return (
+        config['max_score'],
+        config['low_liquidity_penalty'],
+        config['medium_liquidity_penalty'],
+        config['medium_liquidity_threshold']
+    )
+
+
+def refresh_config() -> None:
+    """Drop cached configuration so the next access re-reads the environment."""
+    global _MEMORY_API_ENABLED
+    _MEMORY_API_ENABLED = _read_memory_api_flag()
+    get_filtering_config.cache_clear()
+    get_quality_scoring_config.cache_clear()
+    _quality_score_params.cache_clear()
+    get_rpc_endpoints.cache_clear()
+    get_bot_info.cache_clear()
+
+
+def _retry_schedule(max_retries: Optional[int], delay: Optional[float],
+                    backoff_multiplier: Optional[float]) -> tuple:
     """
-    Decorator for retrying functions on failure with exponential backoff.
+    Resolve retry settings and precompute the backoff delays.
     
-    Args:
-        max_retries: Maximum number of retry attempts
-        delay: Initial delay between retries in seconds
-        backoff_multiplier: Multiplier for exponential backoff
+    Returns:
+        tuple: One base delay (seconds) per retry, already multiplied out
     """
     if max_retries is None:
         max_retries = get_config('MAX_RETRIES', 3, int)
@@ -172,32 +344,167 @@ def retry_on_failure(max_retries: int = None, delay: float = None, backoff_multi
     if backoff_multiplier is None:
         backoff_multiplier = get_config('BACKOFF_MULTIPLIER', 2.0, float)
     
+    return tuple(delay * backoff_multiplier ** i for i in range(max_retries))
+
+
+def _jittered(base_delay: float) -> float:
+    """Add up to 10% random jitter so retries from many callers don't line up."""
+    return base_delay + random.uniform(0, base_delay * 0.1)
+
+
+def retry_on_failure_sync(max_retries: int = None, delay: float = None, backoff_multiplier: float = None):
+    """
+    Decorator for retrying blocking functions on failure with jittered exponential backoff.
+    
+    Args:
+        max_retries: Maximum number of retry attempts
+        delay: Initial delay between retries in seconds
+        backoff_multiplier: Multiplier for exponential backoff
+    """
+    schedule = _retry_schedule(max_retries, delay, backoff_multiplier)
+    attempts = len(schedule) + 1
+    
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            current_delay = delay
-            
-            for attempt in range(max_retries + 1):
+            for attempt, base_delay in enumerate(schedule, 1):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    last_exception = e
-                    
-                    if attempt < max_retries:
-                        log_event(f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {current_delay}s...", 'warning')
-                        time.sleep(current_delay)
-                        current_delay *= backoff_multiplier
-                    else:
-                        log_event(f"All {max_retries + 1} attempts failed for {func.__name__}: {e}", 'error')
+                    current_delay = _jittered(base_delay)
+                    log_event(f"Attempt {attempt} failed for {func.__name__}: {e}. Retrying in {current_delay:.2f}s...", 'warning')
+                    time.sleep(current_delay)
+            
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                log_event(f"All {attempts} attempts failed for {func.__name__}: {e}", 'error')
+                raise
+        
+        return wrapper
+    return decorator
+
+
+def retry_on_failure_async(max_retries: int = None, delay: float = None, backoff_multiplier: float = None):
+    """
+    Decorator for retrying coroutines on failure with jittered exponential backoff.
+    
+    Waits with asyncio.sleep so the event loop keeps running between attempts.
+    
+    Args:
+        max_retries: Maximum number of retry attempts
+        delay: Initial delay between retries in seconds
+        backoff_multiplier: Multiplier for exponential backoff
+    """
+    schedule = _retry_schedule(max_retries, delay, backoff_multiplier)
+    attempts = len(schedule) + 1
+    
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt, base_delay in enumerate(schedule, 1):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    current_delay = _jittered(base_delay)
+                    log_event(f"Attempt {attempt} failed for {func.__name__}: {e}. Retrying in {current_delay:.2f}s...", 'warning')
+                    await asyncio.sleep(current_delay)
             
-            raise last_exception
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                log_event(f"All {attempts} attempts failed for {func.__name__}: {e}", 'error')
+                raise
         
         return wrapper
     return decorator
 
 
-@retry_on_failure()
+def retry_on_failure(max_retries: int = None, delay: float = None, backoff_multiplier: float = None):
+    """
+    Decorator for retrying functions on failure with exponential backoff.
+    
+    Dispatches to retry_on_failure_async for coroutine functions and to
+    retry_on_failure_sync otherwise.
+    
+    Args:
+        max_retries: Maximum number of retry attempts
+        delay: Initial delay between retries in seconds
+        backoff_multiplier: Multiplier for exponential backoff
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            return retry_on_failure_async(max_retries, delay, backoff_multiplier)(func)
+        return retry_on_failure_sync(max_retries, delay, backoff_multiplier)(func)
+    return decorator
+
+
+# Pooled HTTP clients for the memory API: a requests.Session for the
+# synchronous helpers and a lazily created aiohttp session for the async ones
+_requests_session = requests.Session()
+_memory_session: Optional[aiohttp.ClientSession] = None
+_memory_session_loop: Optional[asyncio.AbstractEventLoop] = None  # loop that owns _memory_session
+
+
+def _memory_api_url(endpoint: str) -> str:
+    """Build the full memory API URL for an endpoint path."""
+    base_url = get_config('MEMORY_API_BASE_URL', 'https://pump-memory-server.replit.app')
+    return f"{base_url}{endpoint}"
+
+
+def get_memory_session() -> aiohttp.ClientSession:
+    """
+    Get the shared keep-alive aiohttp session for the memory API.
+    
+    Must be called from within a running event loop. The session is created
+    on first use and reused while the same loop is running; a new loop (e.g.
+    each asyncio.run() call) gets a new session, since one bound to a
+    finished loop can no longer send anything.
+    
+    Returns:
+        aiohttp.ClientSession: Shared session
+    """
+    global _memory_session, _memory_session_loop
+    loop = asyncio.get_running_loop()
+    if _memory_session is None or _memory_session.closed or _memory_session_loop is not loop:
+        _memory_session_loop = loop
+        connector = aiohttp.TCPConnector(
+            limit=get_config('MEMORY_API_POOL_SIZE', 10, int),
+            keepalive_timeout=get_config('MEMORY_API_KEEPALIVE_SECONDS', 60, int)
+        )
+        _memory_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=get_config('MEMORY_API_TIMEOUT', 10, int)),
+            headers={'User-Agent': get_bot_info()['user_agent']}
+        )
+    return _memory_session
+
+
+async def close_memory_session() -> None:
+    """Flush queued memory logs and close the shared memory API session, if one was opened."""
+    global _memory_session, _memory_session_loop
+    await _stop_log_consumer()
+    if _memory_session is not None and not _memory_session.closed:
+        await _memory_session.close()
+    _memory_session = None
+    _memory_session_loop = None
+
+
+def _close_memory_session_at_exit() -> None:
+    """atexit fallback for processes that never awaited close_memory_session()."""
+    session = _memory_session
+    if session is None or session.closed:
+        return
+    try:
+        asyncio.run(session.close())
+    except Exception:
+        pass  # Owning loop is already gone; nothing left to release
+
+
+atexit.register(_close_memory_session_at_exit)
+
+
+@retry_on_failure_sync()
 def post_to_memory(endpoint: str, data: Dict[str, Any], retries: int = None) -> bool:
     """
     Post data to the shared memory API with retries and standardized error handling.
@@ -213,7 +520,7 @@ def post_to_memory(endpoint: str, data: Dict[str, Any], retries: int = None) ->
     try:
         base_url = get_config('MEMORY_API_BASE_URL', 'https://pump-memory-server.replit.app')
         timeout = get_config('MEMORY_API_TIMEOUT', 10, int)
-        user_agent = get_config('MEMORY_API_USER_AGENT', 'PumpBot-Reporter/1.0')
+        user_agent = get_bot_info()['user_agent']
         
         url = f"{base_url}{endpoint}"
         
@@ -222,11 +529,11 @@ def post_to_memory(endpoint: str, data: Dict[str, Any], retries: int = None) ->
             'User-Agent': user_agent
         }
         
-        log_event(f"Posting to memory API: {endpoint}", 'debug')
+        log_event_lazy("Posting to memory API: %s", endpoint, level='debug')
         
-        response = requests.post(
+        response = _requests_session.post(
             url,
-            json=data,
+            data=orjson.dumps(data),
             headers=headers,
             timeout=timeout
         )
@@ -246,7 +553,7 @@ def post_to_memory(endpoint: str, data: Dict[str, Any], retries: int = None) ->
         raise
 
 
-@retry_on_failure()
+@retry_on_failure_sync()
 def get_from_memory(endpoint: str) -> Optional[Dict[str, Any]]:
     """
     Get data from the shared memory API with retries.
@@ -260,7 +567,7 @@ def get_from_memory(endpoint: str) -> Optional[Dict[str, Any]]:
     try:
         base_url = get_config('MEMORY_API_BASE_URL', 'https://pump-memory-server.replit.app')
         timeout = get_config('MEMORY_API_TIMEOUT', 10, int)
-        user_agent = get_config('MEMORY_API_USER_AGENT', 'PumpBot-Reporter/1.0')
+        user_agent = get_bot_info()['user_agent']
         
         url = f"{base_url}{endpoint}"
         
@@ -268,9 +575,9 @@ def get_from_memory(endpoint: str) -> Optional[Dict[str, Any]]:
             'User-Agent': user_agent
         }
         
-        log_event(f"Getting from memory API: {endpoint}", 'debug')
+        log_event_lazy("Getting from memory API: %s", endpoint, level='debug')
         
-        response = requests.get(
+        response = _requests_session.get(
             url,
             headers=headers,
             timeout=timeout
@@ -279,7 +586,7 @@ def get_from_memory(endpoint: str) -> Optional[Dict[str, Any]]:
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
-            log_event(f"Data not found at {endpoint}", 'debug')
+            log_event_lazy("Data not found at %s", endpoint, level='debug')
             return None
         else:
             log_event(f"Memory API returned status {response.status_code} for {endpoint}", 'warning')
@@ -304,7 +611,7 @@ def ping_memory_server() -> bool:
         base_url = get_config('MEMORY_API_BASE_URL', 'https://pump-memory-server.replit.app')
         timeout = get_config('DEFAULT_REQUEST_TIMEOUT', 5, int)
         
-        response = requests.get(f"{base_url}/health", timeout=timeout)
+        response = _requests_session.get(f"{base_url}/health", timeout=timeout)
         
         if response.status_code == 200:
             log_event("Memory server is reachable")
@@ -321,6 +628,105 @@ def ping_memory_server() -> bool:
         return False
 
 
+@retry_on_failure_async()
+async def post_to_memory_async(endpoint: str, data: Dict[str, Any]) -> bool:
+    """
+    Async version: Post data to the shared memory API over the pooled session.
+    
+    Args:
+        endpoint: API endpoint path (e.g., '/memory/append_token')
+        data: Data to post as JSON
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        log_event_lazy("Posting to memory API: %s", endpoint, level='debug')
+        
+        session = get_memory_session()
+        async with session.post(
+            _memory_api_url(endpoint),
+            data=orjson.dumps(data),
+            headers=_JSON_HEADERS
+        ) as response:
+            if response.status == 200:
+                log_event(f"Successfully posted to {endpoint}")
+                return True
+            else:
+                log_event(f"Memory API returned status {response.status} for {endpoint}: {await response.text()}", 'warning')
+                return False
+            
+    except aiohttp.ClientError as e:
+        log_event(f"Network error posting to {endpoint}: {e}", 'error')
+        raise
+    except Exception as e:
+        log_event(f"Error posting to {endpoint}: {e}", 'error')
+        raise
+
+
+@retry_on_failure_async()
+async def get_from_memory_async(endpoint: str) -> Optional[Dict[str, Any]]:
+    """
+    Async version: Get data from the shared memory API over the pooled session.
+    
+    Args:
+        endpoint: API endpoint path (e.g., '/memory/wallet_reputation/address')
+        
+    Returns:
+        dict: Response data or None if not found/error
+    """
+    try:
+        log_event_lazy("Getting from memory API: %s", endpoint, level='debug')
+        
+        session = get_memory_session()
+        async with session.get(_memory_api_url(endpoint)) as response:
+            if response.status == 200:
+                return await response.json()
+            elif response.status == 404:
+                log_event_lazy("Data not found at %s", endpoint, level='debug')
+                return None
+            else:
+                log_event(f"Memory API returned status {response.status} for {endpoint}", 'warning')
+                return None
+            
+    except aiohttp.ClientError as e:
+        log_event(f"Network error getting from {endpoint}: {e}", 'error')
+        raise
+    except Exception as e:
+        log_event(f"Error getting from {endpoint}: {e}", 'error')
+        raise
+
+
+async def ping_memory_server_async() -> bool:
+    """
+    Async version: Test connection to memory server.
+    
+    Returns:
+        bool: True if server is reachable, False otherwise
+    """
+    try:
+        timeout = get_config('DEFAULT_REQUEST_TIMEOUT', 5, int)
+        
+        session = get_memory_session()
+        async with session.get(
+            _memory_api_url('/health'),
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if response.status == 200:
+                log_event("Memory server is reachable")
+                return True
+            else:
+                log_event(f"Memory server health check failed: {response.status}", 'warning')
+                return False
+            
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log_event(f"Cannot reach memory server: {e}", 'warning')
+        return False
+    except Exception as e:
+        log_event(f"Error pinging memory server: {e}", 'error')
+        return False
+
+
 def calculate_quality_score(filter_results: Dict[str, Any], liquidity_sol: float = None) -> float:
     """
     Calculate quality score based on filter results and liquidity.
@@ -332,21 +738,18 @@ def calculate_quality_score(filter_results: Dict[str, Any], liquidity_sol: float
     Returns:
         float: Quality score (0-10)
     """
-    config = get_quality_scoring_config()
-    
     if not filter_results.get('should_alert', False):
         return 0.0
     
-    score = config['max_score']  # Start with perfect score
+    max_score, low_penalty, medium_penalty, medium_threshold = _quality_score_params()
     
-    # Apply liquidity penalties
+    # Apply liquidity penalties (bools as 0/1: at most one penalty applies)
+    score = max_score
     if liquidity_sol is not None:
-        if liquidity_sol < 1.0:
-            score -= config['low_liquidity_penalty']
-        elif liquidity_sol < config['medium_liquidity_threshold']:
-            score -= config['medium_liquidity_penalty']
+        score -= ((liquidity_sol < 1.0) * low_penalty
+                  + (1.0 <= liquidity_sol < medium_threshold) * medium_penalty)
     
-    return max(0.0, min(config['max_score'], score))
+    return max(0.0, min(max_score, score))
 
 
 def format_token_data(token_info, should_alert: bool, filter_details: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -371,11 +774,11 @@ def format_token_data(token_info, should_alert: bool, filter_details: Dict[str,
         quality_score = calculate_quality_score(filter_details, liquidity_sol)
     
     return {
-        'mint': str(token_info.mint),
+        'mint': token_info.mint_str,
         'symbol': token_info.symbol,
-        'creator': str(token_info.creator),
+        'creator': token_info.creator_str,
         'name': token_info.name,
-        'alerted_by': get_config('BOT_IDENTIFIER', 'BOT1'),
+        'alerted_by': get_bot_info()['identifier'],
         'alerted_at': time.time(),
         'status': 'alerted' if should_alert else 'filtered',
         'liquidity_sol': liquidity_sol,
@@ -401,27 +804,28 @@ def format_wallet_intel(address: str, reputation: str, reason: str, **kwargs) ->
         'address': address,
         'reputation': reputation,
         'reason': reason,
-        'reported_by': get_config('BOT_IDENTIFIER', 'BOT1'),
+        'reported_by': get_bot_info()['identifier'],
         'reported_at': time.time(),
         'token_count': kwargs.get('token_count'),
         'success_rate': kwargs.get('success_rate')
     }
 
 
-def get_rpc_endpoints() -> Dict[str, str]:
-    """Get RPC endpoints from environment configuration."""
+@cache
+def get_rpc_endpoints() -> Mapping[str, str]:
+    """Get RPC endpoints from environment configuration (cached, see refresh_config)."""
     helius_key = os.getenv("HELIUS_API_KEY")
     
     if helius_key:
-        return {
+        return MappingProxyType({
             'http': f"https://mainnet.helius-rpc.com/?api-key={helius_key}",
             'ws': f"wss://mainnet.helius-rpc.com/?api-key={helius_key}"
-        }
+        })
     else:
-        return {
+        return MappingProxyType({
             'http': "https://api.mainnet-beta.solana.com",
             'ws': "wss://api.mainnet-beta.solana.com"
-        }
+        })
 
 
 def validate_environment() -> bool:
@@ -452,24 +856,19 @@ def validate_environment() -> bool:
     return True
 
 
-def get_bot_info() -> Dict[str, str]:
-    """Get bot identification information from environment."""
-    return {
+@cache
+def get_bot_info() -> Mapping[str, str]:
+    """Get bot identification information from environment (read once, read-only)."""
+    return MappingProxyType({
         'identifier': get_config('BOT_IDENTIFIER', 'BOT1'),
         'version': get_config('BOT_VERSION', '1.0'),
         'user_agent': get_config('MEMORY_API_USER_AGENT', 'PumpBot-Reporter/1.0')
-    }
-
-
-# Initialize logging when module is imported
-setup_logging()
-
-# Log startup
-bot_info = get_bot_info()
-log_event(f"Utils module initialized - {bot_info['identifier']} v{bot_info['version']}")
+    })
 
 
 if __name__ == "__main__":
+    init_logging()
+    
     # Test utilities
     print("🧪 Testing Utils Module")
     print("=" * 40)
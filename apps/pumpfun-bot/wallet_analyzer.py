@@ -4,22 +4,231 @@ Analyzes wallet behavior to identify potentially suspicious token creators.
 """
 
 import asyncio
+import json
 import time
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+import weakref
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, Callable, Awaitable
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.types import TxOpts
+from solders.commitment_config import CommitmentLevel
 from solders.pubkey import Pubkey
+from solders.rpc.config import RpcSignaturesForAddressConfig
+from solders.rpc.requests import GetSignaturesForAddress
+from solders.rpc.responses import GetSignaturesForAddressResp
 import logging
 
 logger = logging.getLogger(__name__)
 
-# In-memory cache for wallet analysis results
-_wallet_cache = {}
-_cache_ttl = 300  # 5 minutes cache TTL
+# Wallet cache key: (creator_pubkey, min_age_minutes, min_txs)
+WalletCacheKey = Tuple[str, int, int]
 
+# In-memory LRU caches for wallet analysis results: key -> (result, cached_at).
+# Suspicious verdicts are sticky, so they live longer and in their own map
+# where churn among the (much more numerous) safe wallets cannot evict them.
+_suspicious_cache: "OrderedDict[WalletCacheKey, tuple[bool, float]]" = OrderedDict()
+_suspicious_cache_ttl = 3600  # 60 minutes cache TTL
+_suspicious_cache_max_size = 500
 
-def is_wallet_suspicious(
+_safe_cache: "OrderedDict[WalletCacheKey, tuple[bool, float]]" = OrderedDict()
+_safe_cache_ttl = 300  # 5 minutes cache TTL
+_safe_cache_max_size = 100
+
+# Analyses currently running, so concurrent misses on the same key share one
+# RPC round trip. Only touched from the event loop thread, so no lock needed.
+_inflight: "Dict[WalletCacheKey, asyncio.Future[Optional[bool]]]" = {}
+
+# Signature lookups issued in the same event loop iteration are coalesced
+# into JSON-RPC batches of up to BATCH_SIZE
+BATCH_SIZE = 25
+
+
+class WalletBatcher:
+    """
+    Coalesces concurrent getSignaturesForAddress lookups into JSON-RPC batches.
+    
+    Lookups are flushed on the next event loop iteration, so a lone lookup is
+    sent straight away while lookups started together (e.g. via gather) share
+    one HTTP round trip. Responses are matched back to their awaiters by
+    JSON-RPC id, since batch responses may be reordered.
+    
+    Batching uses solana-py's AsyncHTTPProvider.make_batch_request_unparsed
+    (pinned in requirements.txt); if the client's provider lacks it, each
+    lookup falls back to its own get_signatures_for_address call.
+    """
+    
+    def __init__(self, client: AsyncClient, batch_size: int = BATCH_SIZE):
+        # Weak so the batcher (a _batchers value) does not keep its key alive
+        self._client_ref = weakref.ref(client)
+        self.batch_size = batch_size
+        self._pending: List[Tuple[Pubkey, int, asyncio.Future]] = []
+        self._flush_scheduled = False
+        self._dispatches: set = set()  # in-flight dispatch tasks
+        self._next_id = 0
+    
+    async def get_signatures(self, pubkey: Pubkey, limit: int = 10) -> list:
+        """
+        Get the most recent signatures for an address, newest first.
+        
+        Args:
+            pubkey: Address to look up
+            limit: Maximum number of signatures to return
+            
+        Returns:
+            list: Signature records (same as get_signatures_for_address().value)
+            
+        Raises:
+            RuntimeError: If the RPC node returned an error for this address
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((pubkey, limit, future))
+        
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        
+        return await future
+    
+    def _flush(self) -> None:
+        """Dispatch everything queued so far in batches of at most batch_size."""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        
+        loop = asyncio.get_running_loop()
+        for i in range(0, len(pending), self.batch_size):
+            task = loop.create_task(self._dispatch(pending[i:i + self.batch_size]))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[Pubkey, int, asyncio.Future]]) -> None:
+        """Send one batch request and resolve each awaiter's future."""
+        client = self._client_ref()
+        if client is None:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("RPC client was garbage collected"))
+            return
+        
+        make_batch_request = getattr(getattr(client, '_provider', None), 'make_batch_request_unparsed', None)
+        if make_batch_request is None:
+            await asyncio.gather(*(self._fetch_one(client, *item) for item in batch))
+            return
+        
+        pending = {}
+        requests = []
+        for pubkey, limit, future in batch:
+            self._next_id += 1
+            pending[self._next_id] = future
+            config = RpcSignaturesForAddressConfig(limit=limit, commitment=CommitmentLevel.Confirmed)
+            requests.append(GetSignaturesForAddress(pubkey, config, id=self._next_id))
+        
+        try:
+            raw = await make_batch_request(tuple(requests))
+            responses = {item.get('id'): item for item in json.loads(raw)}
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for request_id, future in pending.items():
+            if future.done():
+                continue  # Awaiter was cancelled
+            
+            item = responses.get(request_id)
+            if item is None:
+                future.set_exception(RuntimeError(f"No batch response for request {request_id}"))
+                continue
+            
+            try:
+                future.set_result(parse_signatures_response(item))
+            except Exception as e:
+                future.set_exception(e)
+    
+    @staticmethod
+    async def _fetch_one(client: AsyncClient, pubkey: Pubkey, limit: int, future: asyncio.Future) -> None:
+        """Unbatched lookup for providers without batch support."""
+        try:
+            response = await client.get_signatures_for_address(pubkey, limit=limit, commitment="confirmed")
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        
+        if not future.done():
+            future.set_result(response.value)
+
+
+def parse_signatures_response(item: Optional[Dict[str, Any]]) -> list:
+    """
+    Parse one raw getSignaturesForAddress JSON-RPC response (e.g. from a batch).
+    
+    Args:
+        item: Decoded JSON-RPC response object, or None if none was received
+        
+    Returns:
+        list: Signature records, newest first (same as get_signatures_for_address().value)
+        
+    Raises:
+        RuntimeError: If the response is missing or is an RPC error
+    """
+    if item is None:
+        raise RuntimeError("No getSignaturesForAddress response")
+    
+    parsed = GetSignaturesForAddressResp.from_json(json.dumps(item))
+    if not isinstance(parsed, GetSignaturesForAddressResp):
+        raise RuntimeError(f"RPC error: {parsed}")
+    return parsed.value
+
+
+class _TokenBucket:
+    """
+    Minimal async token-bucket rate limiter.
+    
+    Calls within the configured rate proceed immediately; only calls over the
+    rate wait, and only as long as it takes for a token to refill.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self.capacity = max_rate
+        self._refill_per_second = max_rate / time_period
+        self._tokens = max_rate
+        self._last_refill = time.monotonic()
+    
+    async def __aenter__(self) -> "_TokenBucket":
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self._refill_per_second)
+            self._last_refill = now
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return self
+            
+            await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+    
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+# Wallet analyses allowed per second before callers start waiting
+_rpc_limiter = _TokenBucket(max_rate=10, time_period=1.0)
+
+
+# One batcher per RPC client
+_batchers: "weakref.WeakKeyDictionary[AsyncClient, WalletBatcher]" = weakref.WeakKeyDictionary()
+
+
+def get_wallet_batcher(client: AsyncClient) -> WalletBatcher:
+    """Get the shared WalletBatcher for an RPC client, creating it on first use."""
+    batcher = _batchers.get(client)
+    if batcher is None:
+        batcher = _batchers[client] = WalletBatcher(client)
+    return batcher
+
+
+async def is_wallet_suspicious_async(
     creator_pubkey: str, 
     client: AsyncClient, 
     min_age_minutes: int = 15, 
@@ -38,95 +247,130 @@ def is_wallet_suspicious(
         bool: True if wallet is suspicious, False if safe
               Defaults to True (suspicious) on any errors
     """
-    # Run the async analysis in a synchronous context
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If we're already in an async context, we need to handle this differently
-            return True  # Default to suspicious if we can't analyze
-        else:
-            return loop.run_until_complete(
-                _analyze_wallet_async(creator_pubkey, client, min_age_minutes, min_txs)
-            )
-    except Exception as e:
-        logger.warning(f"Error analyzing wallet {creator_pubkey}: {e}")
-        return True  # Default to suspicious on error
+    async def fetch_signatures() -> list:
+        # Get the last 10 transaction signatures (batched with concurrent lookups)
+        pubkey = Pubkey.from_string(creator_pubkey)
+        return await get_wallet_batcher(client).get_signatures(pubkey, limit=10)
+    
+    return await is_wallet_suspicious_with(creator_pubkey, fetch_signatures, min_age_minutes, min_txs)
 
 
-async def is_wallet_suspicious_async(
+async def is_wallet_suspicious_with(
     creator_pubkey: str, 
-    client: AsyncClient, 
+    fetch_signatures: Callable[[], Awaitable[list]], 
     min_age_minutes: int = 15, 
     min_txs: int = 3
 ) -> bool:
     """
-    Async version: Analyze a wallet to determine if it's suspicious.
+    Variant of is_wallet_suspicious_async where the caller supplies the RPC lookup.
+    
+    Shares the verdict caches, in-flight coalescing and rate limit with
+    is_wallet_suspicious_async, so fetch_signatures is only called when no
+    verdict is cached and no identical analysis is already running.
     
     Args:
         creator_pubkey: The wallet address to analyze
-        client: Solana AsyncClient instance
+        fetch_signatures: Returns the wallet's last 10 signatures, newest first
+                          (see parse_signatures_response); raises on lookup errors
         min_age_minutes: Minimum wallet age in minutes (default: 15)
         min_txs: Minimum transaction count (default: 3)
         
     Returns:
         bool: True if wallet is suspicious, False if safe
-              Defaults to True (suspicious) on any errors
+              Defaults to True (suspicious, not cached) on lookup errors
     """
-    # Check cache first to avoid API calls
-    cache_key = f"{creator_pubkey}_{min_age_minutes}_{min_txs}"
-    current_time = time.time()
+    cache_key = (creator_pubkey, min_age_minutes, min_txs)
     
-    if cache_key in _wallet_cache:
-        cached_result, cached_time = _wallet_cache[cache_key]
-        if current_time - cached_time < _cache_ttl:
+    while True:
+        # Check cache first to avoid API calls
+        current_time = time.time()
+        cached_result = _get_cached_wallet_result(cache_key, current_time)
+        if cached_result is not None:
             logger.debug(f"Using cached wallet analysis for {creator_pubkey}")
             return cached_result
+        
+        fut = _inflight.get(cache_key)
+        if fut is None:
+            break
+        
+        # Join an identical analysis that is already in flight. None means its
+        # leader was cancelled, so look again (and most likely lead the retry).
+        result = await asyncio.shield(fut)
+        if result is not None:
+            return result
     
-    # Add throttling to reduce API load (300ms delay)
-    await asyncio.sleep(0.3)
-    
-    # Perform analysis
-    result = await _analyze_wallet_async(creator_pubkey, client, min_age_minutes, min_txs)
+    fut = _inflight[cache_key] = asyncio.get_running_loop().create_future()
+    try:
+        # Perform analysis, throttled only when over the RPC rate budget
+        try:
+            async with _rpc_limiter:
+                signatures = await fetch_signatures()
+            result = _analyze_signatures(creator_pubkey, signatures, min_age_minutes, min_txs)
+        except Exception as e:
+            # A failed lookup says nothing about the wallet: treat it as
+            # suspicious for this call only and leave the caches alone
+            logger.error(f"Error analyzing wallet {creator_pubkey}: {e}")
+            result = True
+        else:
+            _cache_wallet_result(cache_key, result, current_time)
+        fut.set_result(result)
+    finally:
+        _inflight.pop(cache_key, None)
+        if not fut.done():
+            # Leader was cancelled; release waiters without handing them
+            # the cancellation
+            fut.set_result(None)
     
-    # Cache the result
-    _wallet_cache[cache_key] = (result, current_time)
+    return result
+
+
+def _get_cached_wallet_result(cache_key: WalletCacheKey, current_time: float) -> Optional[bool]:
+    """Return a fresh cached verdict (suspicious cache first), or None on a miss."""
+    for cache, ttl in (
+        (_suspicious_cache, _suspicious_cache_ttl),
+        (_safe_cache, _safe_cache_ttl),
+    ):
+        entry = cache.get(cache_key)
+        if entry is not None and current_time - entry[1] < ttl:
+            cache.move_to_end(cache_key)
+            return entry[0]
+    return None
+
+
+def _cache_wallet_result(cache_key: WalletCacheKey, result: bool, cached_at: float) -> None:
+    """Store an analysis result as most recently used, evicting the LRU entry if full."""
+    if result:
+        cache, other, max_size = _suspicious_cache, _safe_cache, _suspicious_cache_max_size
+    else:
+        cache, other, max_size = _safe_cache, _suspicious_cache, _safe_cache_max_size
     
-    # Clean old cache entries (keep only last 100 entries)
-    if len(_wallet_cache) > 100:
-        oldest_key = min(_wallet_cache.keys(), key=lambda k: _wallet_cache[k][1])
-        del _wallet_cache[oldest_key]
+    # A fresh verdict supersedes any older one in the other cache
+    other.pop(cache_key, None)
+    cache[cache_key] = (result, cached_at)
+    cache.move_to_end(cache_key)
     
-    return result
+    # Evict the least recently used entry of this cache only
+    if len(cache) > max_size:
+        cache.popitem(last=False)
 
 
-async def _analyze_wallet_async(
+def _analyze_signatures(
     creator_pubkey: str, 
-    client: AsyncClient, 
+    signatures: list, 
     min_age_minutes: int, 
     min_txs: int
 ) -> bool:
     """
-    Internal async function to perform wallet analysis.
+    Classify a wallet from its already fetched signatures (newest first).
     
     Returns True if wallet is suspicious, False if safe.
     Defaults to True (suspicious) on any errors.
     """
     try:
-        # Convert string to Pubkey
-        pubkey = Pubkey.from_string(creator_pubkey)
-        
-        # Get the last 10 transaction signatures
-        response = await client.get_signatures_for_address(
-            pubkey, 
-            limit=10,
-            commitment="confirmed"
-        )
-        
-        if not response.value:
+        if not signatures:
             logger.info(f"No transactions found for wallet {creator_pubkey} - marking as suspicious")
             return True  # No transactions = suspicious
             
-        signatures = response.value
         total_txs = len(signatures)
         
         # Check minimum transaction count
@@ -143,7 +387,7 @@ async def _analyze_wallet_async(
             return True
             
         # Calculate wallet age in minutes
-        current_time = datetime.now(timezone.utc).timestamp()
+        current_time = time.time()
         wallet_age_seconds = current_time - oldest_timestamp
         wallet_age_minutes = wallet_age_seconds / 60
         
@@ -175,14 +419,10 @@ async def get_wallet_details(creator_pubkey: str, client: AsyncClient) -> Dict[s
     try:
         pubkey = Pubkey.from_string(creator_pubkey)
         
-        # Get transaction signatures
-        response = await client.get_signatures_for_address(
-            pubkey, 
-            limit=10,
-            commitment="confirmed"
-        )
+        # Get transaction signatures (batched with concurrent lookups)
+        signatures = await get_wallet_batcher(client).get_signatures(pubkey, limit=10)
         
-        if not response.value:
+        if not signatures:
             return {
                 "address": creator_pubkey,
                 "transaction_count": 0,
@@ -194,7 +434,6 @@ async def get_wallet_details(creator_pubkey: str, client: AsyncClient) -> Dict[s
                 "reason": "No transactions found"
             }
             
-        signatures = response.value
         total_txs = len(signatures)
         
         # Calculate age from oldest transaction
@@ -205,13 +444,15 @@ async def get_wallet_details(creator_pubkey: str, client: AsyncClient) -> Dict[s
         wallet_age_hours = 0
         
         if oldest_tx.block_time:
-            current_time = datetime.now(timezone.utc).timestamp()
+            current_time = time.time()
             wallet_age_seconds = current_time - oldest_tx.block_time
             wallet_age_minutes = wallet_age_seconds / 60
             wallet_age_hours = wallet_age_minutes / 60
             
-        # Perform suspicion analysis
-        is_suspicious = await is_wallet_suspicious_async(creator_pubkey, client)
+        # Classify from the signatures already in hand and share the result
+        # with is_wallet_suspicious_async (same default thresholds)
+        is_suspicious = _analyze_signatures(creator_pubkey, signatures, 15, 3)
+        _cache_wallet_result((creator_pubkey, 15, 3), is_suspicious, time.time())
         
         return {
             "address": creator_pubkey,
@@ -9,20 +9,32 @@ import asyncio
 import json
 import logging
 import os
+import random
 import time
-from datetime import datetime
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Tuple
+from dataclasses import dataclass, replace
 
 import aiohttp
+import orjson
 from dotenv import load_dotenv
+from solana.rpc.async_api import AsyncClient
 
 from pump_monitor import PumpMonitor, TokenInfo
+from wallet_analyzer import is_wallet_suspicious_async
 
 # Load environment variables
 load_dotenv()
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class EndpointSpec:
+    """A single webhook destination."""
+    url: str
+    webhook_type: str = "generic"  # "telegram", "discord", "generic"
+    telegram_chat_id: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
 class WebhookConfig:
     """Configuration for webhook alerts."""
     webhook_url: str
@@ -38,27 +50,118 @@ class WebhookConfig:
     # Discord-specific  
     discord_username: Optional[str] = "Pump.fun Alert Bot"
     discord_avatar_url: Optional[str] = None
+    
+    # Additional sinks alerted alongside webhook_url (e.g. Telegram AND Discord)
+    extra_endpoints: Tuple[EndpointSpec, ...] = ()
+    
+    @property
+    def endpoints(self) -> Tuple[EndpointSpec, ...]:
+        """Every destination for an alert, primary webhook first."""
+        primary = EndpointSpec(self.webhook_url, self.webhook_type, self.telegram_chat_id)
+        return (primary, *self.extra_endpoints)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Alerts waiting for delivery before new ones are dropped
+ALERT_QUEUE_SIZE = 256
+
+# Retry / circuit breaker tuning
+MAX_BACKOFF_SECONDS = 10.0
+MAX_RETRY_AFTER_SECONDS = 30.0
+BREAKER_FAILURE_THRESHOLD = 3  # consecutive failed deliveries before opening
+BREAKER_COOLDOWN_SECONDS = 30.0
+
+# Telegram alert body (HTML parse mode), filled per token with str.format_map
+_TELEGRAM_TEMPLATE = """🚀 <b>NEW PUMP.FUN TOKEN LAUNCH</b>
+
+📛 <b>Name:</b> {name}
+🏷️ <b>Symbol:</b> {symbol}
+🆔 <b>Mint:</b> <code>{mint}</code>
+👤 <b>Creator:</b> <code>{creator}</code>
+⏰ <b>Launch Time:</b> {launch_time}
+
+🔗 <b>Links:</b>
+• <a href="{pump_url}">View on Pump.fun</a>
+• <a href="{solscan_url}">Transaction on Solscan</a>
+
+💎 <b>Bonding Curve:</b> <code>{bonding_curve}</code>
+📊 <b>Associated Curve:</b> <code>{associated_bonding_curve}</code>"""
+
+_TELEGRAM_SUSPICIOUS_LINE = "\n\n⚠️ <b>Creator wallet looks suspicious</b> (new or barely used)"
+
+
+def _generate_pump_fun_url(mint_address: str) -> str:
+    """Generate pump.fun URL for the token."""
+    return f"https://pump.fun/{mint_address}"
+
+
+def _generate_solscan_url(signature: str) -> str:
+    """Generate Solscan URL for the transaction."""
+    return f"https://solscan.io/tx/{signature}"
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds; None if absent or not numeric."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
 
 class WebhookAlertBot:
     """Webhook alert bot for pump.fun token launches."""
     
-    def __init__(self, wss_endpoint: str, config: WebhookConfig):
+    def __init__(self, wss_endpoint: str, config: WebhookConfig, rpc_client: Optional[AsyncClient] = None):
         self.wss_endpoint = wss_endpoint
         self.config = config
         self.monitor = PumpMonitor(wss_endpoint)
         self.session: Optional[aiohttp.ClientSession] = None
         
+        # When set, alerts are annotated with a creator wallet suspicion flag
+        self._rpc_client = rpc_client
+        
         # Rate limiting
         self.last_alert_time = 0
         
-        # Statistics
-        self.stats = {
-            "tokens_detected": 0,
-            "webhooks_sent": 0,
-            "webhook_failures": 0,
-            "start_time": datetime.now().isoformat()
+        # Alerts are delivered by a background worker so slow or failing
+        # webhooks never block the detection loop
+        self._alert_queue: asyncio.Queue = asyncio.Queue(maxsize=ALERT_QUEUE_SIZE)
+        self._worker: Optional[asyncio.Task] = None
+        
+        # Per-endpoint circuit breaker state, keyed by URL
+        self._consec_failures: Dict[str, int] = {}
+        self._breaker_open_until: Dict[str, float] = {}
+        
+        # Static parts of the Discord embed; _format_discord_message only
+        # fills in the per-token field values and timestamp
+        self._discord_embed_skeleton = {
+            "title": "🚀 NEW PUMP.FUN TOKEN LAUNCH",
+            "color": 0x00FF00,  # Green color
+            "fields": [
+                {"name": "📛 Token Name", "value": "", "inline": True},
+                {"name": "🏷️ Symbol", "value": "", "inline": True},
+                {"name": "⏰ Launch Time", "value": "", "inline": True},
+                {"name": "🆔 Mint Address", "value": "", "inline": False},
+                {"name": "👤 Creator", "value": "", "inline": False},
+                {"name": "🔗 Quick Links", "value": "", "inline": False}
+            ],
+            "footer": {
+                "text": "Pump.fun Alert Bot",
+                "icon_url": config.discord_avatar_url
+            }
         }
         
+        # Statistics (plain counters; get_stats() builds the dict on demand)
+        self._tokens_detected = 0
+        self._webhooks_sent = 0
+        self._webhook_failures = 0
+        self._alerts_dropped = 0
+        self._start_time_mono = time.monotonic()
+        self._start_time_iso = datetime.now().isoformat()
+        
         # Setup logging
         logging.basicConfig(
             level=logging.INFO,
@@ -72,20 +175,54 @@ class WebhookAlertBot:
         self.logger.info(f"Webhook Type: {self.config.webhook_type}")
         self.logger.info(f"Webhook URL: {self.config.webhook_url}")
         
-        # Initialize HTTP session
-        self.session = aiohttp.ClientSession()
+        # Pooled HTTP session and the delivery worker
+        self.session = self.create_session()
+        self._worker = asyncio.create_task(self._alert_worker())
         
         try:
             await self.monitor.listen_for_tokens(
                 token_callback=self._handle_token_detection
             )
         finally:
+            # Deliver whatever is still queued before tearing down
+            await self._alert_queue.join()
+            self._worker.cancel()
             if self.session:
                 await self.session.close()
 
+    def create_session(self) -> aiohttp.ClientSession:
+        """
+        Create the keep-alive HTTP session used for webhook delivery.
+        
+        Webhooks hit the same few hosts repeatedly, so connections are pooled.
+        The configured timeout applies to every request.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=20,
+            limit_per_host=4,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds)
+        )
+
+    async def _alert_worker(self):
+        """Deliver queued alerts one at a time."""
+        while True:
+            token_info, detected_at, suspicion_task = await self._alert_queue.get()
+            try:
+                await self._send_webhook_alert(token_info, detected_at, suspicion_task)
+            except Exception as e:
+                self.logger.error(f"❌ Unexpected error delivering alert: {e}")
+            finally:
+                self._alert_queue.task_done()
+
     async def _handle_token_detection(self, token_info: TokenInfo):
         """Handle detected token and send webhook alert."""
-        self.stats["tokens_detected"] += 1
+        self._tokens_detected += 1
         
         # Rate limiting check
         current_time = time.time()
@@ -95,98 +232,69 @@ class WebhookAlertBot:
         
         self.last_alert_time = current_time
         
+        # Start the creator wallet analysis now so its RPC round trip overlaps
+        # with queueing and formatting; it is awaited just before encoding
+        suspicion_task = None
+        if self._rpc_client is not None:
+            suspicion_task = asyncio.create_task(
+                is_wallet_suspicious_async(token_info.creator_str, self._rpc_client)
+            )
+        
         # Log detection
         self.logger.info(f"🎯 Token detected: {token_info.name} ({token_info.symbol})")
         self.logger.info(f"   Mint: {token_info.mint}")
         self.logger.info(f"   Creator: {token_info.creator}")
         self.logger.info(f"   TX: {token_info.signature}")
         
-        # Send webhook alert
-        await self._send_webhook_alert(token_info)
-
-    def _generate_pump_fun_url(self, mint_address: str) -> str:
-        """Generate pump.fun URL for the token."""
-        return f"https://pump.fun/{mint_address}"
-
-    def _generate_solscan_url(self, signature: str) -> str:
-        """Generate Solscan URL for the transaction."""
-        return f"https://solscan.io/tx/{signature}"
-
-    def _format_telegram_message(self, token_info: TokenInfo) -> Dict[str, Any]:
-        """Format message for Telegram webhook."""
-        launch_time = datetime.now().strftime("%H:%M:%S UTC")
-        pump_url = self._generate_pump_fun_url(str(token_info.mint))
-        solscan_url = self._generate_solscan_url(token_info.signature)
-        
-        message = f"""🚀 <b>NEW PUMP.FUN TOKEN LAUNCH</b>
-
-📛 <b>Name:</b> {token_info.name}
-🏷️ <b>Symbol:</b> {token_info.symbol}
-🆔 <b>Mint:</b> <code>{token_info.mint}</code>
-👤 <b>Creator:</b> <code>{token_info.creator}</code>
-⏰ <b>Launch Time:</b> {launch_time}
-
-🔗 <b>Links:</b>
-• <a href="{pump_url}">View on Pump.fun</a>
-• <a href="{solscan_url}">Transaction on Solscan</a>
-
-💎 <b>Bonding Curve:</b> <code>{token_info.bonding_curve}</code>
-📊 <b>Associated Curve:</b> <code>{token_info.associated_bonding_curve}</code>"""
+        # Queue webhook alert for the delivery worker
+        try:
+            # Detection time is taken once here and reused by every formatter
+            self._alert_queue.put_nowait((token_info, datetime.now(timezone.utc), suspicion_task))
+        except asyncio.QueueFull:
+            if suspicion_task is not None:
+                suspicion_task.cancel()
+            self._alerts_dropped += 1
+            self.logger.warning(f"Alert queue full, dropping alert for: {token_info.name}")
+
+    def _format_telegram_message(self, token_info: TokenInfo, now_dt: datetime, chat_id: Optional[str] = None) -> Dict[str, Any]:
+        """Format message for Telegram webhook (chat_id defaults to the configured one)."""
+        mint = token_info.mint_str
+        message = _TELEGRAM_TEMPLATE.format_map({
+            "name": token_info.name,
+            "symbol": token_info.symbol,
+            "mint": mint,
+            "creator": token_info.creator_str,
+            "launch_time": now_dt.strftime("%H:%M:%S UTC"),
+            "pump_url": _generate_pump_fun_url(mint),
+            "solscan_url": _generate_solscan_url(token_info.signature),
+            "bonding_curve": token_info.bonding_curve_str,
+            "associated_bonding_curve": token_info.associated_bonding_curve_str
+        })
 
         return {
-            "chat_id": self.config.telegram_chat_id,
+            "chat_id": chat_id or self.config.telegram_chat_id,
             "text": message,
             "parse_mode": self.config.telegram_parse_mode,
             "disable_web_page_preview": False
         }
 
-    def _format_discord_message(self, token_info: TokenInfo) -> Dict[str, Any]:
+    def _format_discord_message(self, token_info: TokenInfo, now_dt: datetime) -> Dict[str, Any]:
         """Format message for Discord webhook."""
-        launch_time = datetime.now().strftime("%H:%M:%S UTC")
-        pump_url = self._generate_pump_fun_url(str(token_info.mint))
-        solscan_url = self._generate_solscan_url(token_info.signature)
+        mint = token_info.mint_str
+        pump_url = _generate_pump_fun_url(mint)
+        solscan_url = _generate_solscan_url(token_info.signature)
         
-        embed = {
-            "title": "🚀 NEW PUMP.FUN TOKEN LAUNCH",
-            "color": 0x00FF00,  # Green color
-            "timestamp": datetime.now().isoformat(),
-            "fields": [
-                {
-                    "name": "📛 Token Name",
-                    "value": token_info.name,
-                    "inline": True
-                },
-                {
-                    "name": "🏷️ Symbol", 
-                    "value": token_info.symbol,
-                    "inline": True
-                },
-                {
-                    "name": "⏰ Launch Time",
-                    "value": launch_time,
-                    "inline": True
-                },
-                {
-                    "name": "🆔 Mint Address",
-                    "value": f"`{token_info.mint}`",
-                    "inline": False
-                },
-                {
-                    "name": "👤 Creator",
-                    "value": f"`{token_info.creator}`",
-                    "inline": False
-                },
-                {
-                    "name": "🔗 Quick Links",
-                    "value": f"[View on Pump.fun]({pump_url}) • [Transaction]({solscan_url})",
-                    "inline": False
-                }
-            ],
-            "footer": {
-                "text": "Pump.fun Alert Bot",
-                "icon_url": self.config.discord_avatar_url
-            }
-        }
+        # Copy the prebuilt skeleton (the footer is shared, never mutated)
+        # and fill the fixed field slots in place
+        embed = dict(self._discord_embed_skeleton)
+        embed["fields"] = fields = [dict(slot) for slot in embed["fields"]]
+        embed["timestamp"] = now_dt  # orjson emits the same string as isoformat()
+        fields[0]["value"] = token_info.name
+        fields[1]["value"] = token_info.symbol
+        fields[2]["value"] = now_dt.strftime("%H:%M:%S UTC")
+        fields[3]["value"] = f"`{mint}`"
+        fields[4]["value"] = f"`{token_info.creator_str}`"
+        fields[5]["value"] = f"[View on Pump.fun]({pump_url}) • [Transaction]({solscan_url})"
 
         payload = {
             "embeds": [embed]
@@ -200,11 +308,11 @@ class WebhookAlertBot:
 
         return payload
 
-    def _format_generic_message(self, token_info: TokenInfo) -> Dict[str, Any]:
+    def _format_generic_message(self, token_info: TokenInfo, now_dt: datetime) -> Dict[str, Any]:
         """Format message for generic webhook."""
-        launch_time = datetime.now().isoformat()
-        pump_url = self._generate_pump_fun_url(str(token_info.mint))
-        solscan_url = self._generate_solscan_url(token_info.signature)
+        launch_time = now_dt.isoformat()
+        pump_url = _generate_pump_fun_url(token_info.mint_str)
+        solscan_url = _generate_solscan_url(token_info.signature)
         
         return {
             "alert_type": "pump_fun_token_launch",
@@ -212,82 +320,167 @@ class WebhookAlertBot:
             "token": {
                 "name": token_info.name,
                 "symbol": token_info.symbol,
-                "mint_address": str(token_info.mint),
-                "creator_address": str(token_info.creator),
-                "bonding_curve": str(token_info.bonding_curve),
-                "associated_bonding_curve": str(token_info.associated_bonding_curve),
+                "mint_address": token_info.mint_str,
+                "creator_address": token_info.creator_str,
+                "bonding_curve": token_info.bonding_curve_str,
+                "associated_bonding_curve": token_info.associated_bonding_curve_str,
                 "metadata_uri": token_info.uri,
                 "transaction_signature": token_info.signature,
                 "launch_time": launch_time,
                 "pump_fun_url": pump_url,
                 "solscan_url": solscan_url
             },
-            "stats": self.stats.copy()
+            "stats": self._counters()
         }
 
-    async def _send_webhook_alert(self, token_info: TokenInfo):
-        """Send webhook alert with retry logic."""
+    async def _send_webhook_alert(
+        self,
+        token_info: TokenInfo,
+        now_dt: datetime,
+        suspicion_task: Optional["asyncio.Task[bool]"] = None
+    ):
+        """Send webhook alert to every configured endpoint concurrently."""
         if not self.session:
             self.logger.error("HTTP session not initialized")
+            if suspicion_task is not None:
+                suspicion_task.cancel()
             return
 
-        # Format message based on webhook type
-        if self.config.webhook_type == "telegram":
-            payload = self._format_telegram_message(token_info)
-            headers = {"Content-Type": "application/json"}
+        # Format each distinct payload once per alert, shared by endpoints of
+        # the same kind (e.g. several generic sinks)
+        endpoints = self.config.endpoints
+        payloads: Dict[tuple, Dict[str, Any]] = {}
+        keys = []
+        for endpoint in endpoints:
+            key = (endpoint.webhook_type, endpoint.telegram_chat_id)
+            if key not in payloads:
+                payloads[key] = self._format_payload(endpoint, token_info, now_dt)
+            keys.append(key)
+        
+        # The creator analysis has been running since detection
+        if suspicion_task is not None:
+            try:
+                creator_suspicious = await suspicion_task
+            except asyncio.CancelledError:
+                # Only the analysis was cancelled; a cancelled worker must still stop
+                if asyncio.current_task().cancelling():
+                    raise
+                self.logger.warning(f"Creator wallet analysis cancelled for {token_info.name}")
+            except Exception as e:
+                self.logger.warning(f"Creator wallet analysis failed for {token_info.name}: {e}")
+            else:
+                for (webhook_type, _), payload in payloads.items():
+                    if webhook_type == "telegram":
+                        if creator_suspicious:
+                            payload["text"] += _TELEGRAM_SUSPICIOUS_LINE
+                    else:
+                        payload["token"]["creator_suspicious"] = creator_suspicious
+        
+        bodies = {key: orjson.dumps(payload) for key, payload in payloads.items()}
+        posts = [
+            self._post_one(endpoint, bodies[key], token_info.name)
+            for endpoint, key in zip(endpoints, keys)
+        ]
+        
+        results = await asyncio.gather(*posts, return_exceptions=True)
+        
+        for result in results:
+            if result is True:
+                self._webhooks_sent += 1
+            else:
+                self._webhook_failures += 1
+                if isinstance(result, Exception):
+                    self.logger.error(f"❌ Unexpected webhook error: {result}")
+
+    def _format_payload(self, endpoint: EndpointSpec, token_info: TokenInfo, now_dt: datetime) -> Dict[str, Any]:
+        """Format the message for an endpoint's webhook type."""
+        if endpoint.webhook_type == "telegram":
+            payload = self._format_telegram_message(token_info, now_dt, endpoint.telegram_chat_id)
         # TODO: re-enable Discord webhook here
-        # elif self.config.webhook_type == "discord":
-        #     payload = self._format_discord_message(token_info)
-        #     headers = {"Content-Type": "application/json"}
+        # elif endpoint.webhook_type == "discord":
+        #     payload = self._format_discord_message(token_info, now_dt)
         else:
-            payload = self._format_generic_message(token_info)
-            headers = {"Content-Type": "application/json"}
+            payload = self._format_generic_message(token_info, now_dt)
+        return payload
+
+    async def _post_one(self, endpoint: EndpointSpec, body: bytes, token_name: str) -> bool:
+        """Send a serialized alert to one endpoint with retry logic; True on success."""
+        # Skip endpoints that keep failing until their cooldown has passed
+        if time.monotonic() < self._breaker_open_until.get(endpoint.url, 0.0):
+            self.logger.debug(f"Circuit open for {endpoint.webhook_type} webhook, skipping {token_name}")
+            return False
 
         # Retry logic
         for attempt in range(self.config.retry_attempts):
+            retry_after = None
             try:
-                async with self.session.post(
-                    self.config.webhook_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds)
-                ) as response:
+                # Body is pre-encoded JSON; the timeout is set on the session
+                response = await self.session.post(endpoint.url, data=body, headers=_JSON_HEADERS)
+                try:
                     if response.status < 400:
-                        self.stats["webhooks_sent"] += 1
-                        self.logger.info(f"✅ Webhook sent successfully for {token_info.name}")
-                        return
-                    else:
-                        error_text = await response.text()
-                        self.logger.warning(
-                            f"❌ Webhook failed (attempt {attempt + 1}): "
-                            f"Status {response.status} - {error_text[:200]}"
-                        )
+                        # Nobody reads a success body; hand the connection
+                        # straight back to the pool
+                        response.release()
+                        self.logger.info(f"✅ Webhook ({endpoint.webhook_type}) sent successfully for {token_name}")
+                        self._consec_failures[endpoint.url] = 0
+                        return True
+                    
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                    error_text = await response.text()
+                    self.logger.warning(
+                        f"❌ Webhook ({endpoint.webhook_type}) failed (attempt {attempt + 1}): "
+                        f"Status {response.status} - {error_text[:200]}"
+                    )
+                finally:
+                    response.release()
                         
             except asyncio.TimeoutError:
-                self.logger.warning(f"⏱️ Webhook timeout (attempt {attempt + 1})")
+                self.logger.warning(f"⏱️ Webhook ({endpoint.webhook_type}) timeout (attempt {attempt + 1})")
             except Exception as e:
-                self.logger.warning(f"❌ Webhook error (attempt {attempt + 1}): {e}")
+                self.logger.warning(f"❌ Webhook ({endpoint.webhook_type}) error (attempt {attempt + 1}): {e}")
             
-            # Wait before retry (exponential backoff)
+            # Wait before retry: honor Retry-After (e.g. Telegram 429s),
+            # otherwise jittered exponential backoff
             if attempt < self.config.retry_attempts - 1:
-                await asyncio.sleep(2 ** attempt)
+                if retry_after is not None:
+                    delay = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+                else:
+                    delay = min(2 ** attempt + random.random() * 0.5, MAX_BACKOFF_SECONDS)
+                await asyncio.sleep(delay)
         
-        self.stats["webhook_failures"] += 1
-        self.logger.error(f"❌ Failed to send webhook after {self.config.retry_attempts} attempts")
+        self.logger.error(f"❌ Failed to send {endpoint.webhook_type} webhook after {self.config.retry_attempts} attempts")
+        
+        failures = self._consec_failures.get(endpoint.url, 0) + 1
+        self._consec_failures[endpoint.url] = failures
+        if failures >= BREAKER_FAILURE_THRESHOLD:
+            self._breaker_open_until[endpoint.url] = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+            self._consec_failures[endpoint.url] = 0
+            self.logger.warning(
+                f"⛔ {endpoint.webhook_type} webhook failed {failures} times in a row; "
+                f"pausing it for {BREAKER_COOLDOWN_SECONDS:.0f}s"
+            )
+        return False
+
+    def _counters(self) -> Dict[str, Any]:
+        """Snapshot of the raw alert counters."""
+        return {
+            "tokens_detected": self._tokens_detected,
+            "webhooks_sent": self._webhooks_sent,
+            "webhook_failures": self._webhook_failures,
+            "alerts_dropped": self._alerts_dropped,
+            "start_time": self._start_time_iso
+        }
 
     def get_stats(self) -> Dict[str, Any]:
         """Get current bot statistics."""
-        runtime = datetime.now() - datetime.fromisoformat(self.stats["start_time"])
+        runtime = time.monotonic() - self._start_time_mono
+        detected = max(self._tokens_detected, 1)
         
         return {
-            **self.stats,
-            "runtime_seconds": int(runtime.total_seconds()),
-            "success_rate": (
-                self.stats["webhooks_sent"] / max(self.stats["tokens_detected"], 1) * 100
-            ),
-            "failure_rate": (
-                self.stats["webhook_failures"] / max(self.stats["tokens_detected"], 1) * 100
-            )
+            **self._counters(),
+            "runtime_seconds": int(runtime),
+            "success_rate": self._webhooks_sent / detected * 100,
+            "failure_rate": self._webhook_failures / detected * 100
         }
 
 
@@ -322,6 +515,21 @@ def create_generic_config(webhook_url: str, rate_limit: float = 1.0) -> WebhookC
     )
 
 
+def parse_extra_endpoints(value: Optional[str]) -> Tuple[EndpointSpec, ...]:
+    """
+    Parse EXTRA_WEBHOOK_URLS into generic endpoints.
+    
+    Args:
+        value: Comma-separated webhook URLs (empty or None for none)
+        
+    Returns:
+        tuple: One generic EndpointSpec per URL
+    """
+    if not value:
+        return ()
+    return tuple(EndpointSpec(url.strip()) for url in value.split(",") if url.strip())
+
+
 async def main():
     """Main function to run the webhook alert bot."""
     # Get configuration from environment
@@ -363,16 +571,28 @@ async def main():
             return
             
         config = create_generic_config(webhook_url)
+    
+    # Further generic sinks that receive every alert alongside the primary one
+    extra_endpoints = parse_extra_endpoints(os.getenv("EXTRA_WEBHOOK_URLS"))
+    if extra_endpoints:
+        config = replace(config, extra_endpoints=extra_endpoints)
 
     # Initialize WebSocket endpoint
     wss_endpoint = f"wss://mainnet.helius-rpc.com/?api-key={helius_api_key}"
     
+    # Optionally flag suspicious creator wallets (one RPC lookup per alert)
+    rpc_client = None
+    if os.getenv("CHECK_CREATOR_WALLET", "false").lower() == "true":
+        rpc_client = AsyncClient(f"https://mainnet.helius-rpc.com/?api-key={helius_api_key}")
+    
     # Initialize and start the bot
-    bot = WebhookAlertBot(wss_endpoint, config)
+    bot = WebhookAlertBot(wss_endpoint, config, rpc_client)
     
     print("🚀 Starting Pump.fun Webhook Alert Bot...")
     print(f"📡 Webhook Type: {webhook_type}")
     print(f"🔗 Endpoint: {config.webhook_url}")
+    if config.extra_endpoints:
+        print(f"🔗 Extra endpoints: {len(config.extra_endpoints)}")
     print("⏹️  Press Ctrl+C to stop and show statistics")
     
     try:
@@ -386,6 +606,9 @@ async def main():
         print(f"   Webhook failures: {stats['webhook_failures']}")
         print(f"   Success rate: {stats['success_rate']:.1f}%")
         print(f"   Runtime: {stats['runtime_seconds']} seconds")
+    finally:
+        if rpc_client is not None:
+            await rpc_client.close()
 
 
 async def webhook_main(finals):
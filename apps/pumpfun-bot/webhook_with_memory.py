@@ -6,29 +6,74 @@ Combines webhook alerts with shared memory reporting and comprehensive filtering
 import asyncio
 import sys
 import time
-import json
 import os
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+import aiohttp
+import orjson
 from solana.rpc.async_api import AsyncClient
-from collections import deque
 
 # Import the pump monitor and filtering components
 from pump_monitor import PumpMonitor, TokenInfo
-from should_alert import should_alert, should_alert_with_details
-from memory_reporter import enhanced_token_handler_with_memory
+from should_alert import evaluate_batched, TokenMetadata
+from memory_reporter import enhanced_token_handler_with_memory, report_token_to_memory_async
 from rollingNew import get_stats
 from filters.pumpNew import passes_hard_filters, launch_score, track_launch_seen, track_alert_sent
 from utils import (
     log_event, 
+    log_event_lazy,
     get_config, 
     get_rpc_endpoints,
     validate_environment,
     get_bot_info,
     format_token_data,
-    ping_memory_server
+    ping_memory_server_async,
+    close_memory_session,
+    init_logging
 )
 
+DENYLIST_PATH = os.path.join('filters', 'denylist.json')
+DENYLIST_RELOAD_INTERVAL = 5.0  # seconds between denylist file mtime checks
+MEMORY_QUEUE_SIZE = 2048  # pending memory reports before new ones are dropped
+MEMORY_WORKERS = 4  # concurrent memory report senders
+MINT_COOLDOWN_SECONDS = 900  # 15 minute per-mint alert cooldown
+LAST_ALERT_MAX_SIZE = 10000  # per-mint alert records kept for cooldown checks
+
+# Alert message templates, filled with str.format_map per alert
+_TELEGRAM_ALERT_TEMPLATE = """🚀 *New Token Alert*
+
+📛 **{name}** `({symbol})`
+🏭 **Creator:** `{creator}`
+🪙 **Mint:** `{mint}`
+⏰ **Time:** {time}
+
+🔗 [View on Pump.fun]({pump_url})
+📊 [View on DexScreener]({dex_url})
+
+✅ *Passed all quality filters*"""
+
+_PLAIN_ALERT_TEMPLATE = """🚀 New Token Alert
+
+📛 {name} ({symbol})
+🏭 Creator: {creator}
+🪙 Mint: {mint}
+⏰ Time: {time}
+
+🔗 Pump.fun: {pump_url}
+📊 DexScreener: {dex_url}
+
+✅ Passed all quality filters"""
+
+@dataclass(slots=True)
+class AlertRecord:
+    """Last alert sent for a mint, used for cooldown and escalation checks."""
+    size_usd: float
+    buyers: int
+    timestamp: float  # time.monotonic()
+
+
 class EnhancedWebhookAlertBot:
     """
     Enhanced webhook alert bot with memory integration and comprehensive filtering.
@@ -42,23 +87,37 @@ class EnhancedWebhookAlertBot:
             'tokens_filtered': 0,
             'memory_reports_sent': 0,
             'memory_reports_failed': 0,
-            'start_time': datetime.now(timezone.utc)
+            'start_time': datetime.now(timezone.utc)  # for display; runtime uses _start_monotonic
         }
+        self._start_monotonic = time.monotonic()
         
         self.client = None
         self.webhook_config = None
         self.monitor = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._req_timeout: Optional[aiohttp.ClientTimeout] = None
         
-        # Per-mint cooldown tracking
-        self.last_alert = {}  # mint -> {'size_usd': float, 'buyers': int, 'timestamp': float}
+        # Memory reports are sent by background workers (over the pooled
+        # memory API session) so they never stall token detection
+        self._mem_queue: asyncio.Queue = asyncio.Queue(maxsize=MEMORY_QUEUE_SIZE)
+        self._mem_workers: list = []
         
-        # Global rate limiting (token bucket: 6 alerts per 10 minutes)
-        self.alert_bucket = deque()
+        # Per-mint cooldown tracking (timestamps are time.monotonic()), oldest
+        # record first so expired and excess entries are evicted from the front
+        self.last_alert: "OrderedDict[str, AlertRecord]" = OrderedDict()
+        
+        # Global rate limiting (token bucket: 6 alerts per 10 minutes, refilled lazily)
         self.bucket_capacity = 6
         self.bucket_window = 600  # 10 minutes
+        self._tokens = float(self.bucket_capacity)
+        self._last_refill = time.monotonic()
+        self._refill_rate = self.bucket_capacity / self.bucket_window  # tokens per second
         
-        # Load denylist
-        self.denylist = self._load_denylist()
+        # Load denylist (reloaded when the file changes, see _refresh_denylist)
+        self._denylist_mtime: Optional[float] = None
+        self._denylist_checked_at = time.monotonic()
+        self.denylist = self._load_denylist() or {"creators": frozenset(), "mints": frozenset()}
+        self._denylist_active = bool(self.denylist["creators"] or self.denylist["mints"])
         
         # Load bot configuration
         bot_info = get_bot_info()
@@ -79,6 +138,22 @@ class EnhancedWebhookAlertBot:
             # Initialize pump monitor
             self.monitor = PumpMonitor(rpc_endpoints['ws'])
             
+            # Shared HTTP session so webhook posts reuse keep-alive connections.
+            # The request timeout is resolved once here, never per alert.
+            self._req_timeout = aiohttp.ClientTimeout(total=get_config('DEFAULT_REQUEST_TIMEOUT', 10, int))
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=4,  # concurrent posts to one webhook/RPC host get their own connections
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            )
+            self._http = aiohttp.ClientSession(connector=connector, timeout=self._req_timeout)
+            
+            self._mem_workers = [
+                asyncio.create_task(self._memory_worker()) for _ in range(MEMORY_WORKERS)
+            ]
+            
             # Test RPC connection
             try:
                 health = await self.client.get_health()
@@ -87,7 +162,7 @@ class EnhancedWebhookAlertBot:
                 log_event(f"RPC connection test failed: {e}", 'warning')
             
             # Test memory server connection
-            if ping_memory_server():
+            if await ping_memory_server_async():
                 log_event("Memory server connection verified")
             else:
                 log_event("Memory server unreachable - continuing without memory features", 'warning')
@@ -147,37 +222,50 @@ class EnhancedWebhookAlertBot:
         Args:
             token_info: Token information from pump monitor
         """
+        # One clock read per event, shared by the denylist, cooldown and rate limit checks
+        now = time.monotonic()
+        
         try:
             self.stats['tokens_detected'] += 1
-            track_launch_seen()  # Track launch for auto-tighten feature
             
-            # Convert TokenInfo to metadata dict for should_alert
-            token_metadata = {
-                'symbol': token_info.symbol,
-                'creator': str(token_info.creator),
-                'mint': str(token_info.mint),
-                'name': token_info.name
-            }
+            # Without an RPC client nothing can be evaluated; bail before any work
+            if not self.client:
+                log_event("No Solana client available - skipping token", 'warning')
+                return
             
-            log_event(f"Processing token: {token_info.name} ({token_info.symbol})")
+            # Base58 forms are encoded once on TokenInfo; reuse them throughout
+            mint_s = token_info.mint_str
+            creator_s = token_info.creator_str
             
-            # Check denylist first
-            if self._is_denylisted(str(token_info.creator), str(token_info.mint)):
+            # Free checks first: nothing below (launch tracking, metadata,
+            # RPC) is spent on incomplete or denylisted tokens
+            if not mint_s or not token_info.name or not token_info.symbol:
+                log_event(f"BLOCKED: Incomplete token data - mint: {mint_s}, name: {token_info.name}, symbol: {token_info.symbol}", 'warning')
+                return
+            
+            if self._is_denylisted(creator_s, mint_s, now):
                 log_event(f"FILTERED: {token_info.name} - Denylisted creator/mint", 'warning')
                 return
             
-            # Get detailed filtering results
-            if self.client:
-                filter_details = await should_alert_with_details(token_metadata, self.client)
-                should_alert_result = filter_details.get('should_alert', False)
-                
-                # CRITICAL: Block alerts when pump.fun API is broken (530 errors = incomplete data)
-                liquidity = filter_details.get('liquidity_sol', 0)
-                if liquidity == 0:
-                    log_event(f"BLOCKED: {token_info.name} - Pump.fun API error or zero liquidity", 'warning')
-                    return
-            else:
-                log_event("No Solana client available - skipping token", 'warning')
+            track_launch_seen()  # Track launch for auto-tighten feature
+            
+            # Convert TokenInfo to the filter input for should_alert
+            token_metadata = TokenMetadata.from_token_info(token_info)
+            
+            log_event_lazy("Processing token: %s (%s)", token_info.name, token_info.symbol)
+            
+            # Get detailed filtering results (wallet history and bonding curve
+            # come back in one JSON-RPC batch)
+            evaluation = await evaluate_batched(token_metadata, self._http)
+            filter_details = evaluation.details
+            should_alert_result = evaluation.should_alert
+            
+            # CRITICAL: Block alerts when the bonding curve read came back empty
+            # (account missing or not yet visible = incomplete data). Absent
+            # means liquidity was never checked (filter disabled or rejected earlier).
+            liquidity = filter_details['details'].get('liquidity_sol')
+            if liquidity == 0:
+                log_event(f"BLOCKED: {token_info.name} - Missing bonding curve data or zero liquidity", 'warning')
                 return
                 
             # Apply rolling stats filtering if initial filters pass
@@ -186,15 +274,18 @@ class EnhancedWebhookAlertBot:
             stats = None
             if should_alert_result:
                 try:
-                    stats = get_stats(str(token_info.mint))
+                    stats = get_stats(mint_s)
                     if stats:
+                        # Read the cooldown inputs once; reused for the alert record
+                        size_usd = stats.get('net_buy_usd', 0)
+                        buyers = stats.get('unique_buyers', 0)
                         passes, reasons = passes_hard_filters(stats)
                         score = launch_score(stats)
                         if passes and score >= 70:
                             # Check per-mint cooldown
-                            if self._check_mint_cooldown(str(token_info.mint), stats):
+                            if self._check_mint_cooldown(mint_s, size_usd, buyers, now):
                                 # Check global rate limit
-                                if self._check_global_rate_limit():
+                                if self._check_global_rate_limit(now):
                                     rolling_stats_pass = True
                                     rolling_score = score
                                     log_event(f"Rolling stats passed for {token_info.symbol}: score {rolling_score}")
@@ -212,14 +303,26 @@ class EnhancedWebhookAlertBot:
             
             # Final alert decision: both filters must pass
             final_alert_decision = should_alert_result and rolling_stats_pass
+            
+            # Report to memory regardless of alert decision. Queued before the
+            # webhook is sent so a _memory_worker delivers it concurrently.
+            try:
+                token_data = format_token_data(token_info, final_alert_decision, filter_details)
+                self._mem_queue.put_nowait(token_data)
+            except asyncio.QueueFull:
+                self.stats['memory_reports_failed'] += 1
+                log_event(f"Memory queue full, dropping report for {token_info.symbol}", 'warning')
+            except Exception as memory_error:
+                self.stats['memory_reports_failed'] += 1
+                log_event(f"Memory reporting error for {token_info.symbol}: {memory_error}", 'error')
                 
             # Log the decision
             if final_alert_decision:
                 self.stats['tokens_alerted'] += 1
                 track_alert_sent()  # Track alert for auto-tighten feature
                 if stats:
-                    self._update_mint_alert_record(str(token_info.mint), stats)  # Update cooldown tracking
-                self._add_to_bucket()  # Add to rate limit bucket
+                    self._update_mint_alert_record(mint_s, size_usd, buyers, now)  # Update cooldown tracking
+                self._add_to_bucket()  # Take a token from the rate limit bucket
                 log_event(f"ALERT APPROVED: {token_info.name} ({token_info.symbol}) - Score: {rolling_score}")
                 
                 # Send webhook alert if configured
@@ -235,62 +338,60 @@ class EnhancedWebhookAlertBot:
                     reasons = ', '.join(filter_details.get('rejection_reasons', ['Unknown']))
                     log_event(f"FILTERED: {token_info.name} - {reasons}", 'warning')
                 
-            # Report to memory regardless of alert decision
+        except Exception as main_error:
+            log_event(f"Token processing error for {token_info.name}: {main_error}", 'error')
+    
+    async def _memory_worker(self):
+        """Send queued token reports to the memory server."""
+        while True:
+            token_data = await self._mem_queue.get()
             try:
-                token_data = format_token_data(token_info, final_alert_decision, filter_details)
-                
-                # Use the memory reporter function
-                from memory_reporter import report_token_to_memory
-                success = report_token_to_memory(token_data)
+                success = await report_token_to_memory_async(token_data)
                 
                 if success:
                     self.stats['memory_reports_sent'] += 1
-                    log_event(f"Memory report sent for {token_info.symbol}", 'debug')
+                    log_event_lazy("Memory report sent for %s", token_data['symbol'], level='debug')
                 else:
                     self.stats['memory_reports_failed'] += 1
-                    log_event(f"Memory report failed for {token_info.symbol}", 'warning')
+                    log_event(f"Memory report failed for {token_data['symbol']}", 'warning')
                     
             except Exception as memory_error:
                 self.stats['memory_reports_failed'] += 1
-                log_event(f"Memory reporting error for {token_info.symbol}: {memory_error}", 'error')
-                
-        except Exception as main_error:
-            log_event(f"Token processing error for {token_info.name}: {main_error}", 'error')
+                log_event(f"Memory reporting error for {token_data.get('symbol')}: {memory_error}", 'error')
+            finally:
+                self._mem_queue.task_done()
     
-    def _check_mint_cooldown(self, mint: str, stats: dict) -> bool:
+    def _check_mint_cooldown(self, mint: str, current_size: float, current_buyers: int, now: float) -> bool:
         """
         Check if mint passes cooldown requirements.
         
         Args:
             mint: Token mint address
-            stats: Current token stats
+            current_size: Current net_buy_usd from the token stats
+            current_buyers: Current unique_buyers from the token stats
+            now: Current time.monotonic() reading
             
         Returns:
             bool: True if alert should be sent (no cooldown or escalation threshold met)
         """
-        now = time.time()
-        
         # If no previous alert for this mint, allow
-        if mint not in self.last_alert:
+        last_record = self.last_alert.get(mint)
+        if last_record is None:
             return True
         
-        last_record = self.last_alert[mint]
-        time_since_last = now - last_record['timestamp']
+        time_since_last = now - last_record.timestamp
         
         # 15 minute cooldown
-        if time_since_last < 900:  # 15 minutes in seconds
+        if time_since_last < MINT_COOLDOWN_SECONDS:
             # Check escalation conditions
-            current_size = stats.get('net_buy_usd', 0)
-            current_buyers = stats.get('unique_buyers', 0)
-            
             # Allow if net_buy_usd >= 2x last alerted value
-            if current_size >= last_record['size_usd'] * 2:
-                log_event(f"Mint {mint} escalation: size {current_size} >= 2x {last_record['size_usd']}")
+            if current_size >= last_record.size_usd * 2:
+                log_event(f"Mint {mint} escalation: size {current_size} >= 2x {last_record.size_usd}")
                 return True
             
             # Allow if unique_buyers increased by 40%
-            if current_buyers >= last_record['buyers'] * 1.4:
-                log_event(f"Mint {mint} escalation: buyers {current_buyers} >= 1.4x {last_record['buyers']}")
+            if current_buyers >= last_record.buyers * 1.4:
+                log_event(f"Mint {mint} escalation: buyers {current_buyers} >= 1.4x {last_record.buyers}")
                 return True
             
             # Otherwise, suppress during cooldown
@@ -299,55 +400,102 @@ class EnhancedWebhookAlertBot:
         # Cooldown expired, allow alert
         return True
     
-    def _update_mint_alert_record(self, mint: str, stats: dict):
+    def _update_mint_alert_record(self, mint: str, size_usd: float, buyers: int, now: float):
         """Update the last alert record for a mint."""
-        if stats:
-            self.last_alert[mint] = {
-                'size_usd': stats.get('net_buy_usd', 0),
-                'buyers': stats.get('unique_buyers', 0),
-                'timestamp': time.time()
-            }
+        self.last_alert[mint] = AlertRecord(size_usd=size_usd, buyers=buyers, timestamp=now)
+        self.last_alert.move_to_end(mint)
+        
+        # Records are in timestamp order: drop those well past their
+        # cooldown, then the oldest ones beyond the size cap
+        expired_before = now - 2 * MINT_COOLDOWN_SECONDS
+        while self.last_alert:
+            oldest = next(iter(self.last_alert.values()))
+            if oldest.timestamp >= expired_before:
+                break
+            self.last_alert.popitem(last=False)
+        while len(self.last_alert) > LAST_ALERT_MAX_SIZE:
+            self.last_alert.popitem(last=False)
     
-    def _load_denylist(self) -> dict:
-        """Load the denylist from JSON file."""
+    def _load_denylist(self) -> Optional[dict]:
+        """
+        Load the denylist from JSON file as frozensets for O(1) lookups.
+        
+        Returns:
+            dict: 'creators' and 'mints' frozensets (empty if there is no file),
+                  or None if the file could not be read or parsed
+        """
+        try:
+            mtime = os.path.getmtime(DENYLIST_PATH)
+        except OSError:
+            self._denylist_mtime = None
+            return {"creators": frozenset(), "mints": frozenset()}
+        
         try:
-            denylist_path = os.path.join('filters', 'denylist.json')
-            if os.path.exists(denylist_path):
-                with open(denylist_path, 'r') as f:
-                    return json.load(f)
-            return {"creators": [], "mints": []}
+            with open(DENYLIST_PATH, 'rb') as f:
+                data = orjson.loads(f.read())
+            denylist = {
+                "creators": frozenset(data.get("creators", [])),
+                "mints": frozenset(data.get("mints", []))
+            }
         except Exception as e:
             log_event(f"Failed to load denylist: {e}", 'warning')
-            return {"creators": [], "mints": []}
+            return None
+        
+        # Only a successful parse records the mtime, so a half-written or
+        # malformed file is retried on the next check
+        self._denylist_mtime = mtime
+        return denylist
+    
+    def _refresh_denylist(self, now: float):
+        """Reload the denylist if its file changed (checked every few seconds)."""
+        if now - self._denylist_checked_at < DENYLIST_RELOAD_INTERVAL:
+            return
+        self._denylist_checked_at = now
+        
+        try:
+            mtime = os.path.getmtime(DENYLIST_PATH)
+        except OSError:
+            mtime = None
+        
+        if mtime != self._denylist_mtime:
+            denylist = self._load_denylist()
+            if denylist is None:
+                return  # Keep enforcing the previous denylist
+            
+            self.denylist = denylist
+            self._denylist_active = bool(denylist["creators"] or denylist["mints"])
+            log_event(
+                f"Denylist reloaded: {len(denylist['creators'])} creators, "
+                f"{len(denylist['mints'])} mints"
+            )
     
-    def _is_denylisted(self, creator: str, mint: str) -> bool:
+    def _is_denylisted(self, creator: str, mint: str, now: float) -> bool:
         """Check if creator or mint is in the denylist."""
-        return (creator in self.denylist.get("creators", []) or 
-                mint in self.denylist.get("mints", []))
+        self._refresh_denylist(now)
+        # Usual case: nothing is denylisted, skip hashing the keys at all
+        if not self._denylist_active:
+            return False
+        return creator in self.denylist["creators"] or mint in self.denylist["mints"]
     
-    def _check_global_rate_limit(self) -> bool:
+    def _check_global_rate_limit(self, now: float) -> bool:
         """
         Check global rate limiting using token bucket algorithm.
         Allows 6 alerts per 10 minutes.
         """
-        now = time.time()
-        
-        # Remove old entries from bucket
-        while self.alert_bucket and now - self.alert_bucket[0] > self.bucket_window:
-            self.alert_bucket.popleft()
+        # Refill for the time elapsed since the last check
+        self._tokens = min(self.bucket_capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+        self._last_refill = now
         
         # Check if bucket has capacity
-        return len(self.alert_bucket) < self.bucket_capacity
+        return self._tokens >= 1
     
     def _add_to_bucket(self):
-        """Add current timestamp to rate limit bucket."""
-        self.alert_bucket.append(time.time())
+        """Take one token from the rate limit bucket."""
+        self._tokens -= 1
     
     async def _send_webhook_alert(self, token_info: TokenInfo):
         """Send webhook alert for approved token."""
         try:
-            import aiohttp
-            
             # Additional validation before sending alert
             if not token_info.mint or not token_info.name or not token_info.symbol:
                 log_event(f"BLOCKED: Incomplete token data - mint: {token_info.mint}, name: {token_info.name}, symbol: {token_info.symbol}", 'error')
@@ -369,18 +517,12 @@ class EnhancedWebhookAlertBot:
                     'content': message
                 }
             
-            # Send the webhook
-            timeout = get_config('DEFAULT_REQUEST_TIMEOUT', 10, int)
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_config['url'],
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=timeout)
-                ) as response:
-                    if response.status == 200:
-                        log_event(f"Webhook sent successfully for {token_info.name}")
-                    else:
-                        log_event(f"Webhook failed: {response.status} - {await response.text()}", 'error')
+            # Send the webhook (uses the session's prebuilt self._req_timeout)
+            async with self._http.post(self.webhook_config['url'], json=payload) as response:
+                if response.status == 200:
+                    log_event(f"Webhook sent successfully for {token_info.name}")
+                else:
+                    log_event(f"Webhook failed: {response.status} - {await response.text()}", 'error')
                         
         except Exception as e:
             log_event(f"Webhook error for {token_info.name}: {e}", 'error')
@@ -388,47 +530,51 @@ class EnhancedWebhookAlertBot:
     def _format_alert_message(self, token_info: TokenInfo) -> str:
         """Format alert message for webhook."""
         # Validate mint address before creating URLs
-        mint_str = str(token_info.mint)
+        mint_str = token_info.mint_str
         if not mint_str or len(mint_str) < 30:  # Basic mint address validation
             log_event(f"Invalid mint address for {token_info.name}: {mint_str}", 'error')
             raise ValueError(f"Invalid mint address: {mint_str}")
             
-        pump_url = f"https://pump.fun/{mint_str}"
-        dexscreener_url = f"https://dexscreener.com/solana/{mint_str}"
+        ctx = {
+            "name": token_info.name,
+            "symbol": token_info.symbol,
+            "creator": token_info.creator_str,
+            "mint": mint_str,
+            "time": datetime.now(timezone.utc).strftime('%H:%M:%S UTC'),
+            "pump_url": f"https://pump.fun/{mint_str}",
+            "dex_url": f"https://dexscreener.com/solana/{mint_str}"
+        }
         
         if self.webhook_config['type'] == 'telegram':
-            return f"""🚀 *New Token Alert*
-
-📛 **{token_info.name}** `({token_info.symbol})`
-🏭 **Creator:** `{token_info.creator}`
-🪙 **Mint:** `{token_info.mint}`
-⏰ **Time:** {datetime.now(timezone.utc).strftime('%H:%M:%S UTC')}
-
-🔗 [View on Pump.fun]({pump_url})
-📊 [View on DexScreener]({dexscreener_url})
-
-✅ *Passed all quality filters*"""
-        else:
-            return f"""🚀 New Token Alert
-
-📛 {token_info.name} ({token_info.symbol})
-🏭 Creator: {token_info.creator}
-🪙 Mint: {token_info.mint}
-⏰ Time: {datetime.now(timezone.utc).strftime('%H:%M:%S UTC')}
-
-🔗 Pump.fun: {pump_url}
-📊 DexScreener: {dexscreener_url}
-
-✅ Passed all quality filters"""
+            return _TELEGRAM_ALERT_TEMPLATE.format_map(ctx)
+        return _PLAIN_ALERT_TEMPLATE.format_map(ctx)
+    
+    async def close(self):
+        """Flush pending memory reports, then close the HTTP session and RPC client."""
+        if self._mem_workers:
+            try:
+                await asyncio.wait_for(self._mem_queue.join(), timeout=10)
+            except asyncio.TimeoutError:
+                log_event(f"Dropping {self._mem_queue.qsize()} unsent memory reports", 'warning')
+            for worker in self._mem_workers:
+                worker.cancel()
+            self._mem_workers = []
+        
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get bot statistics."""
-        runtime = datetime.now(timezone.utc) - self.stats['start_time']
+        runtime_minutes = (time.monotonic() - self._start_monotonic) / 60
         
         return {
             **self.stats,
-            'runtime_minutes': runtime.total_seconds() / 60,
-            'tokens_per_minute': self.stats['tokens_detected'] / max(runtime.total_seconds() / 60, 1),
+            'runtime_minutes': runtime_minutes,
+            'tokens_per_minute': self.stats['tokens_detected'] / max(runtime_minutes, 1),
             'filter_rate': (self.stats['tokens_filtered'] / max(self.stats['tokens_detected'], 1)) * 100,
             'alert_rate': (self.stats['tokens_alerted'] / max(self.stats['tokens_detected'], 1)) * 100,
             'memory_success_rate': (self.stats['memory_reports_sent'] / max(
@@ -459,6 +605,8 @@ class EnhancedWebhookAlertBot:
 
 async def main():
     """Main entry point for enhanced webhook bot."""
+    init_logging()
+    
     try:
         log_event("Enhanced Webhook Alert Bot starting")
         
@@ -491,6 +639,11 @@ async def main():
     except Exception as e:
         log_event(f"Unexpected error: {e}", 'error')
         sys.exit(1)
+        
+    finally:
+        if 'bot' in locals():
+            await bot.close()
+        await close_memory_session()
 
 
 if __name__ == "__main__":